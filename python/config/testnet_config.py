@@ -126,6 +126,13 @@ class TestnetConfig:
     ORDER_MONITOR_INTERVAL = 0.5   # 订单监控间隔(秒)
     POSITION_SYNC_INTERVAL = 1.0   # 持仓同步间隔(秒)
 
+    # 下单通道
+    USE_WS_TRADE_API = True        # 下单/撤单走WebSocket API常驻连接(断开时回退REST)
+
+    # 进程调度 (仅Linux生效)
+    TRADING_CPU = None             # 绑定的CPU核心编号(None不绑定)，建议配合内核参数isolcpus
+    PROCESS_NICE = -10             # 进程nice增量(负值需root权限，无权限时跳过)
+
     # API超时
     API_TIMEOUT = 10               # API请求超时(秒)
     MAX_RETRIES = 3                # 最大重试次数
@@ -5,5 +5,6 @@
 """
 
 from .binance_futures import BinanceFuturesClient
+from .binance_ws_api import BinanceWSTradeClient
 
-__all__ = ["BinanceFuturesClient"]
+__all__ = ["BinanceFuturesClient", "BinanceWSTradeClient"]
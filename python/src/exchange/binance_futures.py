@@ -11,8 +11,10 @@ from enum import Enum
 from typing import Dict, List, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from ..utils.logging_config import get_logger, EventLogger
+from .binance_ws_api import BinanceWSTradeClient
 
 # 使用统一日志系统
 logger = get_logger(__name__)
@@ -222,6 +224,10 @@ class BinanceFuturesClient:
     TESTNET_WS_URL = "wss://stream.binancefuture.com/ws"
     MAINNET_WS_URL = "wss://fstream.binance.com/ws"
 
+    # REST连接池（keep-alive复用TCP/TLS连接；重试由上层决定，不在连接层重发下单请求）
+    POOL_CONNECTIONS = 4
+    POOL_MAXSIZE = 16
+
     def __init__(
         self,
         api_key: str,
@@ -229,9 +235,14 @@ class BinanceFuturesClient:
         testnet: bool = True,
         timeout: int = 10,
         enable_proxy: bool = False,
-        proxy_url: str = None
+        proxy_url: str = None,
+        use_ws_trade_api: bool = False
     ):
-        """初始化客户端"""
+        """初始化客户端
+
+        Args:
+            use_ws_trade_api: 下单/撤单优先走WebSocket API常驻连接，未连接时回退REST
+        """
         self.api_key = api_key
         self.api_secret = api_secret
         self.testnet = testnet
@@ -242,6 +253,11 @@ class BinanceFuturesClient:
         self.ws_url = self.TESTNET_WS_URL if testnet else self.MAINNET_WS_URL
 
         self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(
+            pool_connections=self.POOL_CONNECTIONS,
+            pool_maxsize=self.POOL_MAXSIZE,
+            max_retries=0
+        ))
         self.session.headers.update({
             "X-MBX-APIKEY": self.api_key,
             "Content-Type": "application/json"
@@ -253,6 +269,56 @@ class BinanceFuturesClient:
                 "https": proxy_url
             }
 
+        self.ws_trade: Optional[BinanceWSTradeClient] = None
+        if use_ws_trade_api:
+            self.ws_trade = BinanceWSTradeClient(
+                api_key=api_key,
+                api_secret=api_secret,
+                testnet=testnet,
+                timeout=timeout,
+                proxy_url=proxy_url if enable_proxy else None,
+                recv_window=self._recv_window
+            )
+
+    def prewarm(self) -> bool:
+        """预热REST连接：请求服务器时间，提前完成TCP/TLS握手并放入连接池
+
+        Returns:
+            是否预热成功
+        """
+        response = self._request("GET", "/fapi/v1/time")
+        return not response.get("error")
+
+    def close(self) -> None:
+        """关闭WebSocket API连接和REST连接池"""
+        self.close_ws_trade_api()
+        self.session.close()
+
+    def connect_ws_trade_api(self) -> bool:
+        """建立WebSocket API交易连接，并用account.status预热（完成握手和鉴权）
+
+        Returns:
+            连接是否可用
+        """
+        if self.ws_trade is None or not self.ws_trade.connect():
+            return False
+        response = self.ws_trade.request("account.status")
+        return not response.get("error")
+
+    def close_ws_trade_api(self) -> None:
+        """关闭WebSocket API交易连接"""
+        if self.ws_trade is not None:
+            self.ws_trade.close()
+
+    def _trade_request(self, ws_method: str, http_method: str, endpoint: str, params: Dict) -> Dict:
+        """发送交易请求：WebSocket API已连接时走WS，否则回退REST"""
+        ws_trade = self.ws_trade
+        if ws_trade is not None:
+            if ws_trade.connected:
+                return ws_trade.request(ws_method, params)
+            logger.warning(f"WebSocket API未连接，{ws_method} 回退REST")
+        return self._request(http_method, endpoint, signed=True, params=params)
+
     def _generate_signature(self, params: Dict) -> str:
         """生成请求签名"""
         query_string = "&".join([f"{k}={v}" for k, v in params.items()])
@@ -453,7 +519,7 @@ class BinanceFuturesClient:
         if callback_rate and "TRAILING" in order_type:
             params["callbackRate"] = callback_rate
 
-        response = self._request("POST", "/fapi/v1/order", signed=True, params=params)
+        response = self._trade_request("order.place", "POST", "/fapi/v1/order", params)
 
         # 检查错误响应
         if isinstance(response, dict):
@@ -596,7 +662,7 @@ class BinanceFuturesClient:
         if client_order_id:
             params["origClientOrderId"] = client_order_id
 
-        response = self._request("DELETE", "/fapi/v1/order", signed=True, params=params)
+        response = self._trade_request("order.cancel", "DELETE", "/fapi/v1/order", params)
         return not response.get("error")
 
     def cancel_all_orders(self, symbol: str) -> bool:
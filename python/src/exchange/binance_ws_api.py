@@ -0,0 +1,261 @@
+"""币安期货WebSocket API交易客户端
+
+通过常驻的 ws-fapi 连接发送下单/撤单请求，避免REST每次请求的连接建立开销。
+请求与响应通过 id 关联，连接由后台线程维护（自动响应服务器ping），
+断线（包括服务器24小时会话上限）后在同一线程内按指数退避重连。
+"""
+
+import hashlib
+import hmac
+import itertools
+import random
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+import orjson
+import websocket
+
+from ..utils.logging_config import get_logger, EventLogger
+
+# 使用统一日志系统
+logger = get_logger(__name__)
+events = EventLogger(logger)
+
+
+class BinanceWSTradeClient:
+    """币安期货WebSocket API客户端（仅用于下单/撤单等签名请求）"""
+
+    TESTNET_WS_API_URL = "wss://testnet.binancefuture.com/ws-fapi/v1"
+    MAINNET_WS_API_URL = "wss://ws-fapi.binance.com/ws-fapi/v1"
+
+    # 客户端主动ping间隔（秒），服务器约3分钟ping一次，10分钟无pong断开
+    PING_INTERVAL = 60
+    PING_TIMEOUT = 10
+
+    # 断线重连：指数退避（1, 2, 4, 8...秒，上限30秒），每次等待加±20%抖动
+    RECONNECT_INITIAL_DELAY = 1.0
+    RECONNECT_MAX_DELAY = 30.0
+    RECONNECT_JITTER = 0.2
+
+    def __init__(
+        self,
+        api_key: str,
+        api_secret: str,
+        testnet: bool = True,
+        timeout: int = 10,
+        proxy_url: str = None,
+        recv_window: int = 5000
+    ):
+        """初始化客户端"""
+        self.api_key = api_key
+        self.api_secret = api_secret
+        self.timeout = timeout
+        self._recv_window = recv_window
+        self.url = self.TESTNET_WS_API_URL if testnet else self.MAINNET_WS_API_URL
+
+        self._proxy_kwargs: Dict = {}
+        if proxy_url:
+            proxy = urlparse(proxy_url)
+            # websocket-client只接受http/socks系列代理类型，https代理同样通过HTTP CONNECT建立隧道
+            proxy_type = proxy.scheme or "http"
+            if proxy_type == "https":
+                proxy_type = "http"
+            self._proxy_kwargs = {
+                "http_proxy_host": proxy.hostname,
+                "http_proxy_port": proxy.port,
+                "proxy_type": proxy_type,
+            }
+
+        self.ws: Optional[websocket.WebSocketApp] = None
+        self.ws_thread: Optional[threading.Thread] = None
+        self.connected = False
+        self._connected_event = threading.Event()
+        self._stop_event = threading.Event()
+        self._reconnect_delay = self.RECONNECT_INITIAL_DELAY
+
+        # 等待中的请求: id -> [Event, 响应]
+        self._pending: Dict[int, list] = {}
+        self._pending_lock = threading.Lock()
+        self._ids = itertools.count(1)
+
+    # ==================== 连接管理 ====================
+
+    def connect(self) -> bool:
+        """建立连接并等待就绪
+
+        Returns:
+            是否连接成功
+        """
+        if self.connected:
+            return True
+
+        if self.ws is None:
+            self._connected_event.clear()
+            # 每条连接线程使用独立的停止事件，close()后重新connect()不会唤醒旧线程
+            self._stop_event = threading.Event()
+            self._reconnect_delay = self.RECONNECT_INITIAL_DELAY
+            self.ws = websocket.WebSocketApp(
+                self.url,
+                on_open=self._on_open,
+                on_message=self._on_message,
+                on_error=self._on_error,
+                on_close=self._on_close
+            )
+            self.ws_thread = threading.Thread(
+                target=self._run,
+                args=(self.ws, self._stop_event),
+                daemon=True
+            )
+            self.ws_thread.start()
+
+        if not self._connected_event.wait(self.timeout):
+            logger.warning(f"WebSocket API连接超时: {self.url}")
+            self.close()
+            return False
+        return True
+
+    def close(self) -> None:
+        """关闭连接并停止重连"""
+        self._stop_event.set()
+        self.connected = False
+        if self.ws:
+            self.ws.close()
+            self.ws = None
+        self._fail_pending("connection closed")
+
+    def _run(self, ws: websocket.WebSocketApp, stop_event: threading.Event) -> None:
+        """连接循环：run_forever返回即断线，按指数退避等待后复用同一个WebSocketApp重连"""
+        run_kwargs = {
+            "ping_interval": self.PING_INTERVAL,
+            "ping_timeout": self.PING_TIMEOUT,
+            **self._proxy_kwargs
+        }
+        while not stop_event.is_set():
+            ws.run_forever(**run_kwargs)
+
+            if stop_event.is_set():
+                break
+
+            delay = self._reconnect_delay
+            self._reconnect_delay = min(delay * 2, self.RECONNECT_MAX_DELAY)
+            delay *= random.uniform(1 - self.RECONNECT_JITTER, 1 + self.RECONNECT_JITTER)
+            logger.warning(f"WebSocket API断开，{delay:.1f}秒后重连: {self.url}")
+            if stop_event.wait(delay):
+                break
+
+    def _on_open(self, ws) -> None:
+        self.connected = True
+        self._reconnect_delay = self.RECONNECT_INITIAL_DELAY
+        self._connected_event.set()
+        events.log_websocket_connected(self.url)
+
+    def _on_error(self, ws, error) -> None:
+        if error:
+            logger.warning(f"WebSocket API错误: {str(error)[:120]}")
+
+    def _on_close(self, ws, code, msg) -> None:
+        self.connected = False
+        self._connected_event.clear()
+        events.log_websocket_disconnected(reason=str(msg or code or ""))
+        self._fail_pending("connection closed")
+
+    def _on_message(self, ws, message) -> None:
+        try:
+            data = orjson.loads(message)
+        except orjson.JSONDecodeError:
+            return
+
+        with self._pending_lock:
+            waiter = self._pending.get(data.get("id"))
+        if waiter is not None:
+            waiter[1] = data
+            waiter[0].set()
+
+    def _fail_pending(self, reason: str) -> None:
+        """连接断开时唤醒所有等待中的请求"""
+        with self._pending_lock:
+            waiters = list(self._pending.values())
+        for waiter in waiters:
+            if waiter[1] is None:
+                waiter[1] = {"status": 503, "error": {"code": -1, "msg": reason}}
+            waiter[0].set()
+
+    # ==================== 请求 ====================
+
+    def _sign(self, params: Dict) -> Dict:
+        """添加apiKey/timestamp并按键名排序签名"""
+        params = dict(params)
+        params["apiKey"] = self.api_key
+        params["timestamp"] = int(time.time() * 1000)
+        params["recvWindow"] = self._recv_window
+        params = dict(sorted(params.items()))
+        query_string = "&".join(f"{k}={v}" for k, v in params.items())
+        params["signature"] = hmac.new(
+            self.api_secret.encode("utf-8"),
+            query_string.encode("utf-8"),
+            hashlib.sha256
+        ).hexdigest()
+        return params
+
+    def request(self, method: str, params: Dict = None, signed: bool = True) -> Dict:
+        """发送请求并等待响应
+
+        Args:
+            method: WebSocket API方法 (如 order.place, order.cancel, account.status)
+            params: 请求参数
+            signed: 是否需要签名
+
+        Returns:
+            成功时返回result字段；失败时返回与REST客户端一致的错误结构
+            {"error": True, "message": ..., "code": ..., "msg": ...}
+        """
+        if not self.connected or self.ws is None:
+            return {"error": True, "message": "WebSocket API未连接", "response": {}}
+
+        start_time = time.time()
+        request_id = next(self._ids)
+        payload = {
+            "id": request_id,
+            "method": method,
+            "params": self._sign(params or {}) if signed else (params or {}),
+        }
+
+        waiter = [threading.Event(), None]
+        with self._pending_lock:
+            self._pending[request_id] = waiter
+
+        try:
+            if signed:
+                events.log_api_request("WS", method, **(params or {}))
+            self.ws.send(orjson.dumps(payload).decode("utf-8"))
+
+            if not waiter[0].wait(self.timeout):
+                events.log_api_error("WS", method, "timeout")
+                return {"error": True, "message": f"{method} 响应超时", "response": {}}
+        except Exception as e:
+            events.log_api_error("WS", method, str(e))
+            return {"error": True, "message": str(e), "response": {}}
+        finally:
+            with self._pending_lock:
+                self._pending.pop(request_id, None)
+
+        response = waiter[1] or {}
+        duration_ms = (time.time() - start_time) * 1000
+        status = response.get("status", 0)
+
+        if status != 200:
+            error = response.get("error", {})
+            events.log_api_error("WS", method, f"{status}: {error.get('msg', '')}")
+            return {
+                "error": True,
+                "message": error.get("msg", f"status {status}"),
+                "code": error.get("code"),
+                "msg": error.get("msg", ""),
+                "response": response,
+            }
+
+        if signed:
+            events.log_api_response("WS", method, duration_ms, status)
+        return response.get("result", {})
@@ -6,6 +6,7 @@
 
 from .order_manager import OrderManager, OrderInfo, OrderStatus
 from .position_tracker import PositionTracker, PositionState
+from .signal_factory import TradeSignalFactory
 from .trade_executor import TradeExecutor, TradeResult, TradeSignal
 from .trade_logger import TradeLogger, TradeRecord
 
@@ -15,6 +16,7 @@ __all__ = [
     "OrderStatus",
     "PositionTracker",
     "PositionState",
+    "TradeSignalFactory",
     "TradeExecutor",
     "TradeResult",
     "TradeSignal",
@@ -16,7 +16,9 @@ import time
 from dataclasses import dataclass, field, asdict
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence
+
+import orjson
 
 from .hedge_types import HedgePosition, HedgeState, PinSignal
 
@@ -462,11 +464,12 @@ class HedgeTradeLogger:
 
     # ==================== 导出功能 ====================
 
-    def export_to_json(self, filepath: str = None) -> str:
+    def export_to_json(self, filepath: str = None, records: Sequence[HedgeTradeRecord] = None) -> str:
         """导出为JSON文件
 
         Args:
             filepath: 导出文件路径
+            records: 记录快照，默认使用当前全部记录
 
         Returns:
             文件路径
@@ -475,23 +478,31 @@ class HedgeTradeLogger:
             timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
             filepath = self.log_dir / f"hedge_export_{timestamp}.json"
 
+        if records is None:
+            records = self._records
+
         export_data = {
             "export_time": datetime.now(timezone.utc).isoformat(),
             "runtime_config": self._runtime_config,
             "stats": self.get_stats(),
-            "trades": [r.to_spike_format() for r in self._records]
+            "trades": [r.to_spike_format() for r in records]
         }
 
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(export_data, f, indent=2, ensure_ascii=False)
+        Path(filepath).write_bytes(
+            orjson.dumps(
+                export_data,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE | orjson.OPT_SERIALIZE_NUMPY
+            )
+        )
 
         return str(filepath)
 
-    def export_to_csv(self, filepath: str = None) -> str:
+    def export_to_csv(self, filepath: str = None, records: Sequence[HedgeTradeRecord] = None) -> str:
         """导出为CSV文件
 
         Args:
             filepath: 导出文件路径
+            records: 记录快照，默认使用当前全部记录
 
         Returns:
             文件路径
@@ -500,7 +511,9 @@ class HedgeTradeLogger:
             timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
             filepath = self.log_dir / f"hedge_export_{timestamp}.csv"
 
-        if not self._records:
+        if records is None:
+            records = self._records
+        if not records:
             return str(filepath)
 
         # 扁平化数据结构
@@ -517,7 +530,7 @@ class HedgeTradeLogger:
             writer = csv.DictWriter(f, fieldnames=fieldnames)
             writer.writeheader()
 
-            for record in self._records:
+            for record in records:
                 row = {
                     "trade_id": record.trade_id,
                     "symbol": record.symbol,
@@ -942,6 +942,10 @@ class HedgeTradeManager:
             pass
         return 0.0
 
+    def has_position(self, symbol: str) -> bool:
+        """交易对是否有等待对冲或已对冲的持仓（只读字典成员，不加锁）"""
+        return symbol in self.waiting_hedges or symbol in self.active_hedges
+
     def get_stats(self) -> Dict:
         """获取统计信息"""
         win_rate = (self.winning_trades / self.total_trades * 100) if self.total_trades > 0 else 0
@@ -19,7 +19,7 @@ class HedgeState(Enum):
     CLOSING = "closing"        # 正在平仓
 
 
-@dataclass
+@dataclass(slots=True)
 class PinSignal:
     """插针信号"""
     symbol: str
@@ -203,9 +203,9 @@ class HedgePosition:
         return self.first_leg_pnl, self.second_leg_pnl, self.total_pnl
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class HedgeConfig:
-    """对冲策略配置"""
+    """对冲策略配置（运行期间只读）"""
     enable_hedge: bool = True  # 启用对冲模式
     hedge_retracement_percent: float = 50.0  # 回撤50%时开对冲腿
     hedge_wait_timeout_seconds: int = 60  # 等待对冲的超时时间（秒）
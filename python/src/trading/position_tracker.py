@@ -225,9 +225,10 @@ class PositionTracker:
         self._positions[symbol] = position
         self._risk_warnings[symbol] = False
 
-        if self._on_position_opened:
+        callback = self._on_position_opened
+        if callback is not None:
             try:
-                self._on_position_opened(position)
+                callback(position)
             except Exception as e:
                 print(f"开仓回调错误: {e}")
 
@@ -265,9 +266,10 @@ class PositionTracker:
         self._positions.pop(symbol, None)
         self._risk_warnings.pop(symbol, None)
 
-        if self._on_position_closed:
+        callback = self._on_position_closed
+        if callback is not None:
             try:
-                self._on_position_closed(position)
+                callback(position)
             except Exception as e:
                 print(f"平仓回调错误: {e}")
 
@@ -304,9 +306,10 @@ class PositionTracker:
         self._check_risk(position)
 
         # 触发盈亏更新回调
-        if self._on_pnl_update:
+        callback = self._on_pnl_update
+        if callback is not None:
             try:
-                self._on_pnl_update(position)
+                callback(position)
             except Exception as e:
                 print(f"盈亏更新回调错误: {e}")
 
@@ -445,9 +448,10 @@ class PositionTracker:
         if liq_distance < self.risk_warning_threshold:
             if not self._risk_warnings.get(symbol, False):
                 self._risk_warnings[symbol] = True
-                if self._on_risk_warning:
+                callback = self._on_risk_warning
+                if callback is not None:
                     try:
-                        self._on_risk_warning(position)
+                        callback(position)
                     except Exception as e:
                         print(f"风险警告回调错误: {e}")
         else:
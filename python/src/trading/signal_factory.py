@@ -0,0 +1,96 @@
+"""
+交易信号工厂 - 插针信号验证与TradeSignal构建
+
+每个插针信号都会经过这里，属于热路径。模块只使用带完整类型标注的
+纯数值/字符串逻辑，可直接用mypyc编译为C扩展（编译产物与本模块同名，
+导入方式不变；未编译时按纯Python运行）:
+
+    mypyc src/trading/signal_factory.py
+"""
+
+from .trade_executor import TradeSignal
+
+
+class TradeSignalFactory:
+    """交易信号工厂
+
+    验证阈值、止损止盈、仓位和杠杆在运行期间不变，创建时固化为实例属性。
+    """
+
+    def __init__(
+        self,
+        min_amplitude: float,
+        max_amplitude: float,
+        min_retracement: float,
+        max_retracement: float,
+        stop_loss_percent: float,
+        take_profit_percent: float,
+        position_usdt: float,
+        leverage: int
+    ) -> None:
+        self.min_amplitude = min_amplitude
+        self.max_amplitude = max_amplitude
+        self.min_retracement = min_retracement
+        self.max_retracement = max_retracement
+        self.stop_loss_percent = stop_loss_percent
+        self.take_profit_percent = take_profit_percent
+        self.position_usdt = position_usdt
+        self.leverage = leverage
+
+    def validate(self, amplitude: float, retracement: float) -> bool:
+        """验证信号振幅和回撤是否在配置范围内
+
+        Args:
+            amplitude: 振幅百分比
+            retracement: 回撤百分比
+
+        Returns:
+            是否有效
+        """
+        return (
+            self.min_amplitude <= amplitude <= self.max_amplitude
+            and self.min_retracement <= retracement <= self.max_retracement
+        )
+
+    def build(
+        self,
+        symbol: str,
+        direction: str,
+        start_price: float,
+        peak_price: float,
+        entry_price: float,
+        amplitude: float,
+        retracement: float,
+        signal_id: str = ""
+    ) -> TradeSignal:
+        """构建交易信号
+
+        Returns:
+            TradeSignal对象
+        """
+        # 确定方向
+        if direction == "UP":
+            side = "LONG"
+        elif direction == "DOWN":
+            side = "SHORT"
+        elif peak_price > start_price:
+            # 根据价格变化判断
+            side, direction = "LONG", "UP"
+        else:
+            side, direction = "SHORT", "DOWN"
+
+        return TradeSignal(
+            symbol=symbol,
+            side=side,
+            direction=direction,
+            start_price=start_price,
+            peak_price=peak_price,
+            entry_price=entry_price,
+            amplitude=amplitude,
+            retracement=retracement,
+            stop_loss_percent=self.stop_loss_percent,
+            take_profit_percent=self.take_profit_percent,
+            position_usdt=self.position_usdt,
+            leverage=self.leverage,
+            signal_id=signal_id
+        )
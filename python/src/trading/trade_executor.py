@@ -12,7 +12,7 @@ import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Dict, List, Optional, Callable
+from typing import Callable, Dict, List, Optional, Tuple
 
 from .order_manager import OrderManager, OrderInfo, OrderType
 from .position_tracker import PositionTracker, PositionRecord, PositionState
@@ -29,7 +29,7 @@ class TradeStatus(Enum):
     PARTIAL = "partial"           # 部分平仓
 
 
-@dataclass
+@dataclass(slots=True)
 class TradeSignal:
     """交易信号"""
     symbol: str                   # 交易对
@@ -55,19 +55,27 @@ class TradeSignal:
     source: str = "pin_detector"       # 信号来源
     raw_data: Dict = field(default_factory=dict)
 
+    # 止损止盈价格缓存（信号创建后价格和百分比不再变化）
+    _sl_cache: Optional[float] = field(default=None, init=False, repr=False, compare=False)
+    _tp_cache: Optional[float] = field(default=None, init=False, repr=False, compare=False)
+
     def get_stop_loss_price(self) -> float:
         """获取止损价格"""
-        if self.side == "LONG":
-            return self.entry_price * (1 - self.stop_loss_percent / 100)
-        else:
-            return self.entry_price * (1 + self.stop_loss_percent / 100)
+        if self._sl_cache is None:
+            if self.side == "LONG":
+                self._sl_cache = self.entry_price * (1 - self.stop_loss_percent / 100)
+            else:
+                self._sl_cache = self.entry_price * (1 + self.stop_loss_percent / 100)
+        return self._sl_cache
 
     def get_take_profit_price(self) -> float:
         """获取止盈价格"""
-        if self.side == "LONG":
-            return self.entry_price * (1 + self.take_profit_percent / 100)
-        else:
-            return self.entry_price * (1 - self.take_profit_percent / 100)
+        if self._tp_cache is None:
+            if self.side == "LONG":
+                self._tp_cache = self.entry_price * (1 + self.take_profit_percent / 100)
+            else:
+                self._tp_cache = self.entry_price * (1 - self.take_profit_percent / 100)
+        return self._tp_cache
 
     def get_position_side(self) -> str:
         """获取持仓方向"""
@@ -156,6 +164,9 @@ class TradeExecutor:
         # 交易记录
         self._trades: Dict[str, TradeResult] = {}
         self._trade_counter = 0
+        # 当前持仓对应的交易（每个交易对同时只有一个持仓），开仓时写入，交易完成后移除；
+        # close_all_positions只遍历这里，不扫描全部历史交易
+        self._active_by_symbol: Dict[str, TradeResult] = {}
 
         # 风控状态
         self._circuit_breaker_active = False
@@ -163,6 +174,9 @@ class TradeExecutor:
         self._daily_loss = 0
         self._last_reset_time = time.time()
 
+        # 交易完成回调 callback(result, exit_reason)，在手续费和退出原因确定后调用
+        self._on_trade_closed: Optional[Callable[[TradeResult, str], None]] = None
+
         # 设置回调
         self._setup_callbacks()
 
@@ -201,6 +215,10 @@ class TradeExecutor:
 
         self.position_tracker.set_risk_warning_callback(self._on_risk_warning)
 
+    def set_trade_closed_callback(self, callback: Callable[[TradeResult, str], None]):
+        """设置交易完成回调（手续费已从交易所同步）"""
+        self._on_trade_closed = callback
+
     # ==================== 交易执行 ====================
 
     def execute_signal(self, signal: TradeSignal) -> TradeResult:
@@ -329,21 +347,25 @@ class TradeExecutor:
 
         return False
 
-    def close_all_positions(self, reason: str = "manual") -> int:
+    def close_all_positions(self, reason: str = "manual") -> Tuple[int, int]:
         """平仓所有持仓
 
         Args:
             reason: 平仓原因
 
         Returns:
-            平仓数量
+            (平仓数量, 平仓前活跃持仓数量)
         """
+        # 只遍历当前持仓（快照，平仓过程中会移除条目），不扫描全部历史交易
+        active = [
+            result for result in self._active_by_symbol.values()
+            if result.position and result.position.is_active
+        ]
         closed = 0
-        for trade_id, result in list(self._trades.items()):
-            if result.position and result.position.is_active:
-                if self.close_position(trade_id, reason):
-                    closed += 1
-        return closed
+        for result in active:
+            if self.close_position(result.trade_id, reason):
+                closed += 1
+        return closed, len(active)
 
     # ==================== 风控检查 ====================
 
@@ -356,33 +378,35 @@ class TradeExecutor:
         Returns:
             是否通过
         """
+        config = self.config
+
         # 检查熔断器
         if self._circuit_breaker_active:
-            if time.time() - self._last_reset_time > self.config["circuit_breaker_duration"]:
+            if time.time() - self._last_reset_time > config["circuit_breaker_duration"]:
                 self._circuit_breaker_active = False
                 self._consecutive_losses = 0
             else:
                 return False
 
         # 检查连续亏损
-        if self._consecutive_losses >= self.config["max_consecutive_losses"]:
+        if self._consecutive_losses >= config["max_consecutive_losses"]:
             self._activate_circuit_breaker()
             return False
 
         # 检查每日亏损
-        if abs(self._daily_loss) >= self.config["max_daily_loss_usdt"]:
+        if abs(self._daily_loss) >= config["max_daily_loss_usdt"]:
             self._activate_circuit_breaker()
             return False
 
         # 检查仓位大小
-        if signal.position_usdt > self.config["max_position_usdt"]:
+        if signal.position_usdt > config["max_position_usdt"]:
             return False
 
-        if signal.position_usdt < self.config["min_position_usdt"]:
+        if signal.position_usdt < config["min_position_usdt"]:
             return False
 
         # 检查杠杆
-        if signal.leverage > self.config["max_leverage"]:
+        if signal.leverage > config["max_leverage"]:
             return False
 
         return True
@@ -439,6 +463,7 @@ class TradeExecutor:
             leverage=result.signal.leverage,
             entry_order_id=order.order_id
         )
+        self._active_by_symbol[result.signal.symbol] = result
 
     def _on_stop_loss_triggered(self, order: OrderInfo):
         """止损触发回调"""
@@ -488,6 +513,8 @@ class TradeExecutor:
                 close_price=result.exit_price,
                 realized_pnl=result.realized_pnl
             )
+        if self._active_by_symbol.get(result.signal.symbol) is result:
+            del self._active_by_symbol[result.signal.symbol]
 
         # 获取实际手续费（从交易所）
         result.fee_paid = self._get_actual_fees(result)
@@ -506,6 +533,10 @@ class TradeExecutor:
               f"盈亏: {result.realized_pnl:.4f} USDT "
               f"({result.pnl_percent:.2f}%) 原因: {exit_reason}")
 
+        callback = self._on_trade_closed
+        if callback is not None:
+            callback(result, exit_reason)
+
     def _get_actual_fees(self, result: TradeResult) -> float:
         """获取实际手续费
 
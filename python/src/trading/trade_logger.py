@@ -15,10 +15,15 @@ import time
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence
+
+import orjson
 
 from .trade_executor import TradeResult, TradeSignal
 
+# JSON写出选项：缩进2格；numpy标量/数组按数值输出（与json.dump对numpy.float64的处理一致）
+_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+
 
 @dataclass
 class TradeRecord:
@@ -283,8 +288,7 @@ class TradeLogger:
         filename = f"trade_{record.symbol}_{int(record.signal_time)}.json"
         filepath = self.log_dir / filename
 
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(record.to_spike_format(), f, indent=2, ensure_ascii=False)
+        filepath.write_bytes(orjson.dumps(record.to_spike_format(), option=_JSON_OPTIONS))
 
     def save_all(self):
         """保存所有交易记录"""
@@ -306,20 +310,20 @@ class TradeLogger:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filepath = self.log_dir / f"trades_export_{timestamp}.json"
 
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump({
-                "export_time": datetime.now().isoformat(),
-                "stats": self.get_stats(),
-                "trades": [r.to_spike_format() for r in self._records]
-            }, f, indent=2, ensure_ascii=False)
+        Path(filepath).write_bytes(orjson.dumps({
+            "export_time": datetime.now().isoformat(),
+            "stats": self.get_stats(),
+            "trades": [r.to_spike_format() for r in self._records]
+        }, option=_JSON_OPTIONS))
 
         return str(filepath)
 
-    def export_to_csv(self, filepath: str = None) -> str:
+    def export_to_csv(self, filepath: str = None, records: Sequence[TradeRecord] = None) -> str:
         """导出为CSV文件
 
         Args:
             filepath: 导出文件路径
+            records: 记录快照，默认使用当前全部记录
 
         Returns:
             文件路径
@@ -328,25 +332,26 @@ class TradeLogger:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filepath = self.log_dir / f"trades_export_{timestamp}.csv"
 
-        if not self._records:
+        if records is None:
+            records = self._records
+        if not records:
             return str(filepath)
 
-        # 获取所有字段
-        fieldnames = list(self._records[0].to_dict().keys())
+        rows = [record.to_dict() for record in records]
 
         with open(filepath, "w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
+            writer = csv.DictWriter(f, fieldnames=list(rows[0].keys()))
             writer.writeheader()
-            for record in self._records:
-                writer.writerow(record.to_dict())
+            writer.writerows(rows)
 
         return str(filepath)
 
-    def export_for_analysis(self, filepath: str = None) -> str:
+    def export_for_analysis(self, filepath: str = None, records: Sequence[TradeRecord] = None) -> str:
         """导出为分析脚本兼容的格式
 
         Args:
             filepath: 导出文件路径
+            records: 记录快照，默认使用当前全部记录
 
         Returns:
             文件路径
@@ -355,14 +360,16 @@ class TradeLogger:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filepath = self.log_dir / f"trades_analysis_{timestamp}.json"
 
+        if records is None:
+            records = self._records
+
         export_data = {
             "export_time": datetime.now().isoformat(),
             "stats": self.get_stats(),
-            "trades": [r.to_spike_format() for r in self._records]
+            "trades": [r.to_spike_format() for r in records]
         }
 
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(export_data, f, indent=2, ensure_ascii=False)
+        Path(filepath).write_bytes(orjson.dumps(export_data, option=_JSON_OPTIONS))
 
         return str(filepath)
 
@@ -7,6 +7,7 @@
 - 支持多种handler（控制台、文件、JSON）
 - 支持日志上下文管理
 - 结构化事件日志
+- 异步写入（QueueHandler + QueueListener），不阻塞调用线程
 
 Usage:
     from src.utils.logging_config import get_logger, setup_logging
@@ -25,8 +26,11 @@ Usage:
     logger.event("order_placed", "订单已提交", symbol="BTCUSDT", qty=0.1)
 """
 
+import atexit
 import json
 import logging
+import logging.handlers
+import queue
 import sys
 import uuid
 from contextlib import contextmanager
@@ -143,12 +147,16 @@ class ContextAdapter(logging.LoggerAdapter):
     def _log(self, level: int, msg: Any, args: tuple, **kwargs):
         """内部日志方法"""
         if self.isEnabledFor(level):
-            self.logger._log(level, msg, args, **self.process(msg, kwargs))
+            msg, kwargs = self.process(msg, kwargs)
+            self.logger._log(level, msg, args, **kwargs)
 
 
 # 全局logger缓存
 _loggers: Dict[str, ContextAdapter] = {}
 
+# 后台日志写入线程（QueueListener）
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
 
 def get_logger(name: str) -> ContextAdapter:
     """获取结构化logger
@@ -186,7 +194,8 @@ def setup_logging(
     log_dir: str = "logs",
     console_level: str = "INFO",
     file_level: str = "DEBUG",
-    enable_json: bool = True
+    enable_json: bool = True,
+    use_queue: bool = True
 ) -> None:
     """配置日志系统
 
@@ -195,7 +204,10 @@ def setup_logging(
         console_level: 控制台日志级别 (DEBUG/INFO/WARNING/ERROR)
         file_level: 文件日志级别 (DEBUG/INFO/WARNING/ERROR)
         enable_json: 是否启用JSON结构化日志
+        use_queue: 是否通过QueueHandler异步写日志（格式化和I/O在后台线程执行）
     """
+    global _queue_listener
+
     log_path = Path(log_dir)
     log_path.mkdir(exist_ok=True)
 
@@ -205,8 +217,13 @@ def setup_logging(
     root_logger = logging.getLogger()
     root_logger.setLevel(logging.DEBUG)
 
-    # 清除已有handlers
+    # 清除已有handlers，停止旧的后台写入线程
     root_logger.handlers.clear()
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+    handlers: List[logging.Handler] = []
 
     # 控制台handler (人类可读格式)
     console_handler = logging.StreamHandler(sys.stdout)
@@ -216,14 +233,14 @@ def setup_logging(
         datefmt='%H:%M:%S'
     )
     console_handler.setFormatter(console_formatter)
-    root_logger.addHandler(console_handler)
+    handlers.append(console_handler)
 
     # 主文件handler
     main_file = log_path / f"bot_{today}.log"
     file_handler = logging.FileHandler(main_file, encoding='utf-8')
     file_handler.setLevel(getattr(logging, file_level.upper(), logging.DEBUG))
     file_handler.setFormatter(console_formatter)
-    root_logger.addHandler(file_handler)
+    handlers.append(file_handler)
 
     if enable_json:
         # JSON结构化日志 - 所有事件
@@ -231,7 +248,7 @@ def setup_logging(
         events_handler = logging.FileHandler(events_file, encoding='utf-8')
         events_handler.setLevel(logging.INFO)
         events_handler.setFormatter(StructuredFormatter())
-        root_logger.addHandler(events_handler)
+        handlers.append(events_handler)
 
         # JSON结构化日志 - 仅信号事件
         signals_file = log_path / f"signals_{today}.jsonl"
@@ -245,7 +262,7 @@ def setup_logging(
             return event.startswith("signal_") or extra_data.get("event", "").startswith("signal_")
 
         signals_handler.addFilter(_signal_filter)
-        root_logger.addHandler(signals_handler)
+        handlers.append(signals_handler)
 
         # JSON结构化日志 - 仅订单事件
         orders_file = log_path / f"orders_{today}.jsonl"
@@ -258,20 +275,43 @@ def setup_logging(
             extra_data = getattr(record, "extra_data", {})
             return event.startswith("order_") or extra_data.get("event", "").startswith("order_")
         orders_handler.addFilter(_order_filter)
-        root_logger.addHandler(orders_handler)
+        handlers.append(orders_handler)
 
     # 错误文件handler
     errors_file = log_path / f"errors_{today}.log"
     error_handler = logging.FileHandler(errors_file, encoding='utf-8')
     error_handler.setLevel(logging.ERROR)
     error_handler.setFormatter(console_formatter)
-    root_logger.addHandler(error_handler)
+    handlers.append(error_handler)
+
+    if use_queue:
+        # 调用线程只做一次queue.put，格式化和写文件由QueueListener线程完成
+        log_queue: queue.Queue = queue.Queue(-1)
+        root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        _queue_listener = logging.handlers.QueueListener(
+            log_queue, *handlers, respect_handler_level=True
+        )
+        _queue_listener.start()
+    else:
+        for handler in handlers:
+            root_logger.addHandler(handler)
 
     # 设置基本库的日志级别
     logging.getLogger("urllib3").setLevel(logging.WARNING)
     logging.getLogger("websocket").setLevel(logging.WARNING)
 
 
+def shutdown_logging() -> None:
+    """停止后台日志线程并写出队列中剩余的日志"""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+atexit.register(shutdown_logging)
+
+
 @contextmanager
 def log_context(logger: ContextAdapter, **context):
     """日志上下文管理器 - 临时添加上下文数据
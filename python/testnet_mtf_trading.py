@@ -8,17 +8,25 @@
 - 两阶段入场：检测入第一腿，回调入第二腿锁利
 """
 
-import json
 import signal
 import sys
 import threading
 import time
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
-from typing import List
+from typing import Dict, List
 
+import numpy as np
+import orjson
+import pandas as pd
 import websocket
 
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+
 # 添加src目录到路径
 script_dir = Path(__file__).parent.resolve()
 sys.path.insert(0, str(script_dir / "src"))
@@ -44,6 +52,17 @@ USE_PROXY = True
 
 BEIJING_TZ = timezone(timedelta(hours=8))
 WS_ENDPOINT = "wss://stream.binancefuture.com/ws"
+RECONNECT_INITIAL_DELAY = 1.0    # 重连初始等待（秒）
+RECONNECT_MAX_DELAY = 30.0       # 重连最大等待（秒），指数退避
+
+# WS线程 -> 处理线程 的SPSC环形缓冲区
+RING_CAPACITY = 65536            # 必须为2的幂，下标用位与取模
+RING_MASK = RING_CAPACITY - 1
+RING_DTYPE = np.dtype([("sid", np.int32), ("price", np.float64), ("ts", np.int64)])
+
+# 对冲执行器价格转发合并: 价格变动超过阈值或距上次转发超时才转发
+HEDGE_FORWARD_MIN_MOVE = 0.0001      # 0.01%
+HEDGE_FORWARD_MAX_INTERVAL_MS = 100
 
 DEFAULT_SYMBOLS = [
     # 主流币
@@ -61,6 +80,16 @@ DEFAULT_SYMBOLS = [
 ]
 
 
+# aggTrade消息结构
+
+if MSGSPEC_AVAILABLE:
+    class AggTradeMessage(msgspec.Struct, gc=False):
+        """aggTrade消息中用到的字段（其余字段解码时忽略）"""
+        s: str      # 交易对
+        p: float    # 成交价（币安以字符串下发，非严格模式下自动转换）
+        T: int      # 成交时间（毫秒）
+
+
 # WebSocket行情接收器
 
 class MarketDataReceiver:
@@ -76,59 +105,104 @@ class MarketDataReceiver:
     ):
         self.symbols_upper = [s.upper() for s in symbols]
         self.symbols_lower = [s.lower() for s in symbols]
+        self._ws_url = f"{WS_ENDPOINT}/" + "/".join(f"{s}@aggTrade" for s in self.symbols_lower)
         self.kline_manager = kline_manager
         self.hedge_executor = hedge_executor
         self.detector_manager = detector_manager
         self.config = config
 
+        # 处理管线在构造后固定，预先绑定方法，省去每个tick的属性查找
+        self._on_price_kline = kline_manager.on_price
+        self._get_tracker = kline_manager.get_tracker
+        self._on_price_detector = detector_manager.on_price
+        self._on_kline_close = detector_manager.on_kline_close
+        self._detect = detector_manager.detect
+        self._on_price_hedge = hedge_executor.on_price_update
+        self._on_signal = hedge_executor.on_signal
+
+        # 每个symbol上次转发给对冲执行器的价格和时间（按symbol_id索引）
+        self._last_fwd_price: List[float] = [0.0] * len(self.symbols_upper)
+        self._last_fwd_ts: List[int] = [0] * len(self.symbols_upper)
+
         self.running = False
         self.ws_connected = False
         self.ws = None
         self.ws_thread = None
+        self.consumer_thread = None
+        self._stop_event = threading.Event()
+        self._reconnect_delay = RECONNECT_INITIAL_DELAY
         self.message_count = 0
         self.signal_count = 0
+        self.dropped_count = 0
 
         # 用于检测K线收盘
         self._last_kline_close: Dict[str, int] = {}  # symbol -> timestamp
 
+        # SPSC环形缓冲区: 每个元素为 (symbol_id, price, timestamp_ms) 结构体
+        # head只由WS线程写，tail只由消费线程写，GIL保证单次赋值的可见性
+        self._symbol_ids: Dict[str, int] = {s: i for i, s in enumerate(self.symbols_upper)}
+        self._ring = np.empty(RING_CAPACITY, dtype=RING_DTYPE)
+        self._ring_head = 0
+        self._ring_tail = 0
+        # 缓冲区为空时消费线程在此等待；WS线程仅在消费线程清除后（空->非空）置位
+        self._ring_ready = threading.Event()
+
+        # 优先使用msgspec按结构解码，避免dict分配和float()转换
+        self._decoder = (
+            msgspec.json.Decoder(AggTradeMessage, strict=False) if MSGSPEC_AVAILABLE else None
+        )
+
     def start(self) -> None:
         self.running = True
+        self._stop_event.clear()
+        self.consumer_thread = threading.Thread(target=self._consume_loop, daemon=True)
+        self.consumer_thread.start()
         self._connect()
 
     def stop(self) -> None:
         self.running = False
+        self._stop_event.set()
+        self._ring_ready.set()  # 唤醒等待中的消费线程
         if self.ws:
             self.ws.close()
 
     def _connect(self) -> None:
-        streams = [f"{s}@aggTrade" for s in self.symbols_lower]
-        ws_url = f"{WS_ENDPOINT}/{'/'.join(streams)}"
-
-        print(f"[{self._format_time()}] 连接WebSocket...")
-
+        """创建WebSocketApp和唯一的连接线程，断线重连都在该线程内完成"""
         self.ws = websocket.WebSocketApp(
-            ws_url,
+            self._ws_url,
             on_message=self._on_message,
             on_error=self._on_error,
             on_close=self._on_close,
             on_open=self._on_open
         )
 
-        def run_ws():
-            if USE_PROXY:
-                self.ws.run_forever(
-                    http_proxy_host=PROXY_HOST,
-                    http_proxy_port=PROXY_HTTP_PORT,
-                    proxy_type="http"
-                )
-            else:
-                self.ws.run_forever()
-
-        self.ws_thread = threading.Thread(target=run_ws, daemon=True)
+        self.ws_thread = threading.Thread(target=self._run_ws, daemon=True)
         self.ws_thread.start()
 
+    def _run_ws(self) -> None:
+        """连接循环：run_forever返回即断线，按指数退避等待后复用同一个WebSocketApp重连"""
+        proxy_kwargs = {
+            "http_proxy_host": PROXY_HOST,
+            "http_proxy_port": PROXY_HTTP_PORT,
+            "proxy_type": "http",
+        } if USE_PROXY else {}
+
+        while self.running:
+            print(f"[{self._format_time()}] 连接WebSocket...")
+            self.ws.run_forever(**proxy_kwargs)
+
+            if not self.running:
+                break
+
+            delay = self._reconnect_delay
+            self._reconnect_delay = min(delay * 2, RECONNECT_MAX_DELAY)
+            print(f"[{self._format_time()}] {delay:.0f}秒后重连...")
+            if self._stop_event.wait(delay):
+                break
+
     def _on_open(self, ws) -> None:
         self.ws_connected = True
+        self._reconnect_delay = RECONNECT_INITIAL_DELAY
         print(f"[{self._format_time()}] WebSocket已连接")
         self._load_historical_klines()
 
@@ -139,38 +213,89 @@ class MarketDataReceiver:
     def _on_close(self, ws, code, msg) -> None:
         self.ws_connected = False
         print(f"[{self._format_time()}] WebSocket断开")
-        if self.running:
-            print(f"[{self._format_time()}] 2秒后重连...")
-            time.sleep(2)
-            self._connect()
 
     def _on_message(self, ws, message) -> None:
+        """WS线程只负责解析和入队，策略处理交给消费线程"""
         try:
             self.message_count += 1
-            data = json.loads(message)
+            if self._decoder is not None:
+                trade = self._decoder.decode(message)
+                symbol, price, timestamp_ms = trade.s, trade.p, trade.T
+            else:
+                data = orjson.loads(message)
+                symbol, price, timestamp_ms = data['s'], float(data['p']), data['T']
 
-            symbol = data.get('s', '').upper()
-            if symbol not in self.symbols_upper:
+            # 币安aggTrade的symbol已是大写，直接查表
+            sid = self._symbol_ids.get(symbol)
+            if sid is None:
                 return
 
-            price = float(data['p'])
-            timestamp_ms = data['T']
+            head = self._ring_head
+            if head - self._ring_tail >= RING_CAPACITY:
+                self.dropped_count += 1  # 消费线程跟不上，丢弃最新tick
+                return
+
+            self._ring[head & RING_MASK] = (sid, price, timestamp_ms)
+            self._ring_head = head + 1
 
-            self._process_price(symbol, price, timestamp_ms)
+            # 先发布head再检查：消费线程清除事件后会重新检查head，不会漏掉唤醒
+            ready = self._ring_ready
+            if not ready.is_set():
+                ready.set()
         except Exception:
             pass
 
-    def _process_price(self, symbol: str, price: float, timestamp_ms: int) -> None:
+    def _consume_loop(self) -> None:
+        """消费线程：批量取出环形缓冲区中的tick并执行策略处理"""
+        ring = self._ring
+        symbols = self.symbols_upper
+        ready = self._ring_ready
+
+        while self.running:
+            tail = self._ring_tail
+            pending = self._ring_head - tail
+            if pending == 0:
+                # 清除后再检查一次，避免清除前刚写入的tick得不到唤醒
+                ready.clear()
+                if self._ring_head == tail:
+                    ready.wait()
+                continue
+
+            # 一次取出连续的一段（环尾回绕时分两次取），按字段整列拷出后释放槽位
+            start = tail & RING_MASK
+            count = min(pending, RING_CAPACITY - start)
+            batch = ring[start:start + count]
+            sids = batch["sid"].tolist()
+            prices = batch["price"].tolist()
+            timestamps = batch["ts"].tolist()
+            self._ring_tail = tail + count
+
+            for sid, price, timestamp_ms in zip(sids, prices, timestamps):
+                try:
+                    self._process_price(sid, price, timestamp_ms)
+                except Exception as e:
+                    logger.debug(f"价格处理异常 {symbols[sid]}: {e}")
+
+    def _process_price(self, sid: int, price: float, timestamp_ms: int) -> None:
+        symbol = self.symbols_upper[sid]
+
         # 更新K线追踪器
-        self.kline_manager.on_price(symbol, price, timestamp_ms)
+        self._on_price_kline(symbol, price, timestamp_ms)
 
         # 更新检测器的价格历史
-        self.detector_manager.on_price(symbol, price, timestamp_ms)
+        self._on_price_detector(symbol, price, timestamp_ms)
 
-        # 更新对冲执行器
-        self.hedge_executor.on_price_update(symbol, price)
+        # 更新对冲执行器（合并小幅、高频的价格更新）
+        last_price = self._last_fwd_price[sid]
+        if (
+            timestamp_ms - self._last_fwd_ts[sid] >= HEDGE_FORWARD_MAX_INTERVAL_MS
+            or abs(price - last_price) > last_price * HEDGE_FORWARD_MIN_MOVE
+        ):
+            self._on_price_hedge(symbol, price)
+            self._last_fwd_price[sid] = price
+            self._last_fwd_ts[sid] = timestamp_ms
 
-        tracker = self.kline_manager.get_tracker(symbol)
+        tracker = self._get_tracker(symbol)
 
         # 检测1m K线收盘（用于更新ATR）
         atr_tf = Timeframe.MIN_1
@@ -180,23 +305,18 @@ class MarketDataReceiver:
             # 检测K线是否切换（新K线开始）
             last_close = self._last_kline_close.get(symbol, 0)
             if candle_start > last_close:
-                # 上一根K线收盘，更新ATR
+                # 上一根K线收盘，更新ATR（须在本tick检测插针之前完成）
                 if tf_data.klines:
                     closed_kline = tf_data.klines[-1]
-                    self.detector_manager.on_kline_close(symbol, closed_kline)
+                    self._on_kline_close(symbol, closed_kline)
                 self._last_kline_close[symbol] = candle_start
 
         # 检测插针信号
-        signal = self.detector_manager.detect(
-            symbol,
-            tracker,
-            price,
-            timestamp_ms
-        )
+        signal = self._detect(symbol, tracker, price, timestamp_ms)
 
         if signal:
             self.signal_count += 1
-            self.hedge_executor.on_signal(signal)
+            self._on_signal(signal)
 
     def _get_binance_interval(self, tf: Timeframe) -> str | None:
         """Timeframe转币安API interval格式
@@ -451,32 +571,22 @@ class MTFTradingRunner:
         if not self._trade_records:
             return
 
-        import json
-        from pathlib import Path
-
         log_dir = Path("testnet_trades")
         log_dir.mkdir(exist_ok=True)
 
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
-        # 导出JSON
+        # 导出JSON（orjson直接输出UTF-8字节）
         json_path = log_dir / f"hedge_trades_{timestamp}.json"
-        with open(json_path, "w", encoding="utf-8") as f:
-            json.dump({
-                "export_time": datetime.now().isoformat(),
-                "total_trades": len(self._trade_records),
-                "trades": self._trade_records
-            }, f, indent=2, ensure_ascii=False)
-
-        # 导出CSV
+        json_path.write_bytes(orjson.dumps({
+            "export_time": datetime.now().isoformat(),
+            "total_trades": len(self._trade_records),
+            "trades": self._trade_records
+        }, option=orjson.OPT_INDENT_2))
+
+        # 导出CSV（pandas C写入器，避免逐行DictWriter）
         csv_path = log_dir / f"hedge_trades_{timestamp}.csv"
-        if self._trade_records:
-            import csv
-            with open(csv_path, "w", newline="", encoding="utf-8") as f:
-                fieldnames = list(self._trade_records[0].keys())
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(self._trade_records)
+        pd.DataFrame(self._trade_records).to_csv(csv_path, index=False, encoding="utf-8")
 
         logger.info(f"交易记录已导出: {json_path.name}, {csv_path.name}")
 
@@ -15,13 +15,25 @@
 2. 运行脚本:
    python testnet_trading.py
 
+   低延迟运行(Linux): 在testnet_config中设置TRADING_CPU，并隔离该核心
+   (内核参数 isolcpus=N)，以实时调度策略启动:
+   sudo chrt -f 50 python testnet_trading.py
+
 3. 或作为模块导入到test_pin_recorder.py中
 """
 
+import asyncio
+import logging
+import os
+import queue
 import signal
 import sys
+import threading
 import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed, wait
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import Dict, Optional
 
@@ -33,47 +45,91 @@ sys.path.insert(0, str(script_dir))
 from src.exchange.binance_futures import BinanceFuturesClient
 from src.trading.order_manager import OrderManager
 from src.trading.position_tracker import PositionTracker
-from src.trading.trade_executor import TradeExecutor, TradeSignal
+from src.trading.signal_factory import TradeSignalFactory
+from src.trading.trade_executor import TradeExecutor
 from src.trading.trade_logger import TradeLogger
 from config.testnet_config import load_config, TestnetConfig
 
 
+# 终端颜色和输出模板（%格式，由输出线程延迟格式化）
+_GREEN, _RED, _RESET = "\033[92m", "\033[91m", "\033[0m"
+_CLOSE_FMT = (
+    "\n[持仓平仓] %s\n"
+    "  盈亏: %s%+.4f USDT%s (%+.2f%%)\n"
+    "  持仓时长: %.1f秒"
+)
+
+# 交易事件终端输出：运行器运行期间由其监听线程格式化并写stdout（见_start_console），
+# 未运行时直接同步写stdout
+_console_stdout = logging.StreamHandler(sys.stdout)
+_console_stdout.setFormatter(logging.Formatter("%(message)s"))
+
+console = logging.getLogger("testnet")
+console.addHandler(_console_stdout)
+console.setLevel(logging.INFO)
+console.propagate = False
+
+
 class TestnetTradingRunner:
     """测试网交易运行器
 
     集成所有交易组件，提供完整的测试网交易功能。
     """
 
+    # 状态打印间隔（秒）
+    STATUS_INTERVAL_SECONDS = 10
+
+    # 盈亏显示刷新间隔（秒）和缓冲区大小
+    PNL_FLUSH_INTERVAL = 1 / 30
+    PNL_BUFFER_SIZE = 256
+
     def __init__(self, config: TestnetConfig = None):
         """初始化运行器
 
         Args:
             config: 测试网配置
         """
-        self.config = config or load_config()
+        self.config = cfg = config or load_config()
         self.running = False
 
+        # 信号验证与构建（配置参数在运行期间不变，预先固化）
+        self._signal_factory = TradeSignalFactory(
+            min_amplitude=cfg.MIN_SPIKE_PERCENT,
+            max_amplitude=cfg.MAX_SPIKE_PERCENT,
+            min_retracement=cfg.MIN_RETRACEMENT,
+            max_retracement=cfg.MAX_RETRACEMENT,
+            stop_loss_percent=cfg.DEFAULT_STOP_LOSS_PERCENT,
+            take_profit_percent=cfg.DEFAULT_TAKE_PROFIT_PERCENT,
+            position_usdt=cfg.POSITION_USDT,
+            leverage=cfg.LEVERAGE
+        )
+
+        # 启动探测和数据导出用的线程池（并行发出REST探测/并行写文件）
+        self._probe_pool = ThreadPoolExecutor(max_workers=3, thread_name_prefix="probe")
+
         # 初始化客户端
         self.client = BinanceFuturesClient(
-            api_key=self.config.BINANCE_API_KEY,
-            api_secret=self.config.BINANCE_API_SECRET,
+            api_key=cfg.BINANCE_API_KEY,
+            api_secret=cfg.BINANCE_API_SECRET,
             testnet=True,
-            timeout=self.config.API_TIMEOUT,
-            enable_proxy=self.config.ENABLE_PROXY,
-            proxy_url=self.config.PROXY_URL if self.config.ENABLE_PROXY else None
+            timeout=cfg.API_TIMEOUT,
+            enable_proxy=cfg.ENABLE_PROXY,
+            proxy_url=cfg.PROXY_URL if cfg.ENABLE_PROXY else None,
+            use_ws_trade_api=cfg.USE_WS_TRADE_API
         )
+        self.client.prewarm()
 
         # 初始化组件
         self.order_manager = OrderManager(
             exchange_client=self.client,
             enable_auto_monitor=True,
-            monitor_interval=self.config.ORDER_MONITOR_INTERVAL
+            monitor_interval=cfg.ORDER_MONITOR_INTERVAL
         )
 
         self.position_tracker = PositionTracker(
             exchange_client=self.client,
-            risk_warning_threshold=self.config.RISK_WARNING_THRESHOLD,
-            auto_sync_interval=self.config.POSITION_SYNC_INTERVAL
+            risk_warning_threshold=cfg.RISK_WARNING_THRESHOLD,
+            auto_sync_interval=cfg.POSITION_SYNC_INTERVAL
         )
 
         self.trade_executor = TradeExecutor(
@@ -81,25 +137,25 @@ class TestnetTradingRunner:
             order_manager=self.order_manager,
             position_tracker=self.position_tracker,
             config={
-                "max_position_usdt": self.config.MAX_POSITION_USDT,
-                "min_position_usdt": self.config.MIN_POSITION_USDT,
-                "max_leverage": self.config.MAX_LEVERAGE,
-                "max_daily_trades": self.config.MAX_DAILY_TRADES,
-                "max_consecutive_losses": self.config.MAX_CONSECUTIVE_LOSSES,
-                "max_daily_loss_usdt": self.config.MAX_DAILY_LOSS_USDT,
-                "fee_rate": self.config.FEE_RATE,
-                "slippage_tolerance": self.config.SLIPPAGE_TOLERANCE,
-                "enable_circuit_breaker": self.config.ENABLE_CIRCUIT_BREAKER,
-                "circuit_breaker_duration": self.config.CIRCUIT_BREAKER_DURATION,
+                "max_position_usdt": cfg.MAX_POSITION_USDT,
+                "min_position_usdt": cfg.MIN_POSITION_USDT,
+                "max_leverage": cfg.MAX_LEVERAGE,
+                "max_daily_trades": cfg.MAX_DAILY_TRADES,
+                "max_consecutive_losses": cfg.MAX_CONSECUTIVE_LOSSES,
+                "max_daily_loss_usdt": cfg.MAX_DAILY_LOSS_USDT,
+                "fee_rate": cfg.FEE_RATE,
+                "slippage_tolerance": cfg.SLIPPAGE_TOLERANCE,
+                "enable_circuit_breaker": cfg.ENABLE_CIRCUIT_BREAKER,
+                "circuit_breaker_duration": cfg.CIRCUIT_BREAKER_DURATION,
                 "enable_stop_loss": True,
                 "enable_take_profit": True,
             }
         )
 
         self.trade_logger = TradeLogger(
-            log_dir=self.config.TRADE_LOG_DIR,
-            auto_save=self.config.ENABLE_AUTO_SAVE,
-            save_interval=self.config.SAVE_INTERVAL
+            log_dir=cfg.TRADE_LOG_DIR,
+            auto_save=cfg.ENABLE_AUTO_SAVE,
+            save_interval=cfg.SAVE_INTERVAL
         )
 
         # 设置回调
@@ -110,13 +166,38 @@ class TestnetTradingRunner:
         self._signals_received = 0
         self._signals_executed = 0
 
+        # 事件循环与信号队列（run()运行期间有效）
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._signal_queue: Optional[asyncio.Queue] = None
+        self._next_status_at = 0.0
+
+        # 盈亏更新缓冲区（满时丢弃最旧的），由后台线程刷新到终端
+        self._pnl_buffer: deque = deque(maxlen=self.PNL_BUFFER_SIZE)
+        self._pnl_thread: Optional[threading.Thread] = None
+
+        # 终端输出队列：回调线程只把记录放入队列，由监听线程写stdout
+        self._console_queue: queue.Queue = queue.Queue(-1)
+        self._console_handler = QueueHandler(self._console_queue)
+        self._console_listener: Optional[QueueListener] = None
+
     def _setup_callbacks(self):
         """设置回调函数"""
-        # 持仓状态回调
-        self.position_tracker.set_position_opened_callback(self._on_position_opened)
-        self.position_tracker.set_position_closed_callback(self._on_position_closed)
+        # 持仓状态回调（显示开关在运行期间不变，关闭时不注册输出回调，
+        # PositionTracker对None回调直接跳过）
+        cfg = self.config
+        show_position = cfg.SHOW_POSITION_UPDATES
+        self.position_tracker.set_position_opened_callback(
+            self._on_position_opened if show_position else None
+        )
+        self.position_tracker.set_position_closed_callback(
+            self._on_position_closed if show_position else None
+        )
+        # 交易记录在手续费和退出原因确定后写入
+        self.trade_executor.set_trade_closed_callback(self._record_closed_trade)
         self.position_tracker.set_risk_warning_callback(self._on_risk_warning)
-        self.position_tracker.set_pnl_update_callback(self._on_pnl_update)
+        self.position_tracker.set_pnl_update_callback(
+            self._on_pnl_update if cfg.SHOW_PNL_UPDATES else None
+        )
 
     # ==================== 启动停止 ====================
 
@@ -132,7 +213,13 @@ class TestnetTradingRunner:
             return
 
         self.running = True
-        self._start_time = time.time()
+        self._start_time = time.monotonic()
+        self._apply_process_scheduling()
+        self._start_console()
+
+        if self.config.SHOW_PNL_UPDATES:
+            self._pnl_thread = threading.Thread(target=self._pnl_flush_loop, daemon=True)
+            self._pnl_thread.start()
 
         print("\n" + "=" * 60)
         print("测试网交易运行器已启动")
@@ -152,12 +239,14 @@ class TestnetTradingRunner:
         print("\n正在停止交易运行器...")
         self.running = False
 
+        # 先唤醒事件循环，使run()退出（后续步骤出错也不会让run()挂起）
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._signal_queue.put_nowait, None)
+
         # 平仓所有持仓
-        active_count = len(self.trade_executor.get_active_trades())
+        closed, active_count = self.trade_executor.close_all_positions(reason="shutdown")
         if active_count > 0:
-            print(f"正在平仓 {active_count} 个活跃持仓...")
-            closed = self.trade_executor.close_all_positions(reason="shutdown")
-            print(f"已平仓 {closed} 个持仓")
+            print(f"活跃持仓 {active_count} 个，已平仓 {closed} 个")
 
         # 停止监控
         self.order_manager.stop_monitoring()
@@ -165,8 +254,77 @@ class TestnetTradingRunner:
         # 导出数据
         self._export_data()
 
+        # 关闭交易连接
+        self.client.close()
+        self._probe_pool.shutdown(wait=False)
+
+        # 输出剩余的终端记录并停止监听线程
+        self._stop_console()
+
         print("交易运行器已停止")
 
+    def _start_console(self):
+        """启动终端输出监听线程，console改为经队列输出"""
+        if self._console_listener is not None:
+            return
+        self._console_listener = QueueListener(self._console_queue, _console_stdout)
+        self._console_listener.start()
+        console.removeHandler(_console_stdout)
+        console.addHandler(self._console_handler)
+
+    def _stop_console(self):
+        """写出队列中剩余的终端记录并停止监听线程，console恢复为同步输出（可重复调用）"""
+        listener = self._console_listener
+        if listener is None:
+            return
+        self._console_listener = None
+        console.removeHandler(self._console_handler)
+        console.addHandler(_console_stdout)
+        listener.stop()
+
+    async def run(self):
+        """事件驱动主循环
+
+        等待信号队列，信号到达后立即执行；每次唤醒时把队列中积压的信号一并取出处理。
+        状态打印由事件循环定时回调完成，不再轮询。
+        """
+        self._loop = asyncio.get_running_loop()
+        self._signal_queue = asyncio.Queue()
+        self._next_status_at = self._loop.time() + self.STATUS_INTERVAL_SECONDS
+        self._loop.call_at(self._next_status_at, self._on_status_timer)
+
+        try:
+            while self.running:
+                batch = [await self._signal_queue.get()]
+                while not self._signal_queue.empty():
+                    batch.append(self._signal_queue.get_nowait())
+
+                for signal_data in batch:
+                    if signal_data is not None:  # None为stop()的唤醒标记
+                        self.on_pin_signal(signal_data)
+        finally:
+            self._loop = None
+            self._signal_queue = None
+
+    def submit_signal(self, signal_data: Dict):
+        """投递插针信号（线程安全，供WebSocket回调线程调用）
+
+        run()未运行时直接同步执行。
+        """
+        loop = self._loop
+        if loop is None:
+            self.on_pin_signal(signal_data)
+            return
+        loop.call_soon_threadsafe(self._signal_queue.put_nowait, signal_data)
+
+    def _on_status_timer(self):
+        """定时打印状态（按单调时钟的固定截止时间触发，不累积漂移）"""
+        if not self.running or self._loop is None:
+            return
+        self.print_status()
+        self._next_status_at += self.STATUS_INTERVAL_SECONDS
+        self._loop.call_at(self._next_status_at, self._on_status_timer)
+
     # ==================== 信号处理 ====================
 
     def on_pin_signal(self, signal_data: Dict) -> Optional[str]:
@@ -190,165 +348,183 @@ class TestnetTradingRunner:
 
         self._signals_received += 1
 
+        # 一次性取出信号字段，后续验证和构建直接使用局部变量
+        try:
+            symbol = signal_data["symbol"]
+            direction = signal_data["direction"]
+            start_price = signal_data["start_price"]
+            peak_price = signal_data["peak_price"]
+            entry_price = signal_data["entry_price"]
+            amplitude = signal_data["amplitude"]
+            retracement = signal_data["retracement"]
+        except KeyError as e:
+            console.info("信号缺少必要字段: %s", e.args[0])
+            return None
+
         # 信号验证
-        if not self._validate_signal(signal_data):
+        if not self._signal_factory.validate(amplitude, retracement):
             return None
 
         # 创建交易信号
-        trade_signal = self._create_trade_signal(signal_data)
+        trade_signal = self._signal_factory.build(
+            symbol, direction, start_price, peak_price, entry_price,
+            amplitude, retracement, signal_data.get("signal_id", "")
+        )
 
         # 执行交易
         result = self.trade_executor.execute_signal(trade_signal)
 
         if result.status.value in ["opened", "submitted"]:
             self._signals_executed += 1
-            print(f"\n✓ 信号已执行: {signal_data['symbol']} {signal_data['direction']}")
-            print(f"  入场价: {trade_signal.entry_price}")
-            print(f"  止损: {trade_signal.get_stop_loss_price():.6f} ({trade_signal.stop_loss_percent}%)")
-            print(f"  止盈: {trade_signal.get_take_profit_price():.6f} ({trade_signal.take_profit_percent}%)")
+            sl = trade_signal.get_stop_loss_price()
+            tp = trade_signal.get_take_profit_price()
+            console.info(
+                "\n✓ 信号已执行: %s %s\n  入场价: %s\n  止损: %.6f (%s%%)\n  止盈: %.6f (%s%%)",
+                symbol, direction,
+                trade_signal.entry_price,
+                sl, trade_signal.stop_loss_percent,
+                tp, trade_signal.take_profit_percent
+            )
             return result.trade_id
         else:
-            print(f"\n✗ 信号执行失败: {signal_data['symbol']} - {result.error_message}")
+            console.info("\n✗ 信号执行失败: %s - %s", symbol, result.error_message)
             return None
 
     # ==================== 内部方法 ====================
 
-    def _test_connection(self) -> bool:
-        """测试交易所连接
+    def _apply_process_scheduling(self):
+        """绑定CPU核心并提升调度优先级，减少上下文切换带来的延迟抖动
 
-        Returns:
-            是否连接成功
+        仅Linux支持；不支持或无权限时跳过，不影响运行。
         """
-        try:
-            # 测试REST API
-            if not self.client.test_connectivity():
-                print("无法连接到币安测试网")
-                return False
-
-            # 获取账户信息
-            account = self.client.get_account_info()
-            if account:
-                print(f"✓ 连接成功")
-                print(f"  可用余额: {account.available_balance:.2f} USDT")
-                print(f"  总余额: {account.total_wallet_balance:.2f} USDT")
-                return True
-            else:
-                print("无法获取账户信息，请检查API密钥")
-                return False
+        cpu = self.config.TRADING_CPU
+        if cpu is not None and hasattr(os, "sched_setaffinity"):
+            try:
+                os.sched_setaffinity(0, {cpu})
+                print(f"  CPU绑定: 核心 {cpu}")
+            except OSError as e:
+                print(f"  CPU绑定失败: {e}")
+
+        nice = self.config.PROCESS_NICE
+        if nice and hasattr(os, "nice") and (nice > 0 or os.geteuid() == 0):
+            try:
+                os.nice(nice)
+            except OSError as e:
+                print(f"  调整优先级失败: {e}")
 
-        except Exception as e:
-            print(f"连接测试失败: {e}")
-            return False
-
-    def _validate_signal(self, signal_data: Dict) -> bool:
-        """验证信号数据
+    def _test_connection(self) -> bool:
+        """测试交易所连接
 
-        Args:
-            signal_data: 信号数据
+        连通性、账户信息和WebSocket API预热三个探测并行发出，
+        启动耗时约为一次往返；任一必要探测失败即立即返回，
+        并收回WebSocket API预热建立的连接和探测线程池。
 
         Returns:
-            是否有效
+            是否连接成功
         """
-        required_fields = ["symbol", "direction", "start_price", "peak_price", "entry_price", "amplitude", "retracement"]
+        ws_future = None
+        if self.config.USE_WS_TRADE_API:
+            # 预热WebSocket API下单通道，避免首笔订单承担握手开销
+            ws_future = self._probe_pool.submit(self.client.connect_ws_trade_api)
 
-        for field in required_fields:
-            if field not in signal_data:
-                print(f"信号缺少必要字段: {field}")
-                return False
-
-        # 检查振幅
-        if signal_data["amplitude"] < self.config.MIN_SPIKE_PERCENT:
-            return False
+        connectivity_future = self._probe_pool.submit(self.client.test_connectivity)
+        account_future = self._probe_pool.submit(self.client.get_account_info)
 
-        if signal_data["amplitude"] > self.config.MAX_SPIKE_PERCENT:
-            return False
-
-        # 检查回撤
-        if signal_data["retracement"] < self.config.MIN_RETRACEMENT:
-            return False
+        passed = False
+        try:
+            account = None
+            for future in as_completed((connectivity_future, account_future)):
+                if future is connectivity_future:
+                    if not future.result():
+                        print("无法连接到币安测试网")
+                        return False
+                else:
+                    account = future.result()
+                    if not account:
+                        print("无法获取账户信息，请检查API密钥")
+                        return False
+
+            print(f"✓ 连接成功")
+            print(f"  可用余额: {account.available_balance:.2f} USDT")
+            print(f"  总余额: {account.total_wallet_balance:.2f} USDT")
+
+            if ws_future is not None:
+                if ws_future.result():
+                    print("  下单通道: WebSocket API")
+                else:
+                    print("  下单通道: REST (WebSocket API连接失败)")
+            passed = True
+            return True
 
-        if signal_data["retracement"] > self.config.MAX_RETRACEMENT:
+        except Exception as e:
+            print(f"连接测试失败: {e}")
             return False
 
-        return True
-
-    def _create_trade_signal(self, signal_data: Dict) -> TradeSignal:
-        """创建交易信号
-
-        Args:
-            signal_data: 信号数据
+        finally:
+            if not passed:
+                self._abort_probes(ws_future)
 
-        Returns:
-            TradeSignal对象
-        """
-        # 确定方向
-        direction = signal_data["direction"]
-        if direction == "UP":
-            side = "LONG"
-        elif direction == "DOWN":
-            side = "SHORT"
-        else:
-            # 根据价格变化判断
-            if signal_data["peak_price"] > signal_data["start_price"]:
-                side = "LONG"
-                direction = "UP"
-            else:
-                side = "SHORT"
-                direction = "DOWN"
-
-        return TradeSignal(
-            symbol=signal_data["symbol"],
-            side=side,
-            direction=direction,
-            start_price=signal_data["start_price"],
-            peak_price=signal_data["peak_price"],
-            entry_price=signal_data.get("entry_price", signal_data["peak_price"]),
-            amplitude=signal_data["amplitude"],
-            retracement=signal_data["retracement"],
-            stop_loss_percent=self.config.DEFAULT_STOP_LOSS_PERCENT,
-            take_profit_percent=self.config.DEFAULT_TAKE_PROFIT_PERCENT,
-            position_usdt=self.config.POSITION_USDT,
-            leverage=self.config.LEVERAGE,
-            signal_id=signal_data.get("signal_id", ""),
-            raw_data=signal_data
-        )
+    def _abort_probes(self, ws_future: Optional[Future]):
+        """连接测试失败时清理：取消或等待WebSocket API预热，关闭其建立的连接，并关闭探测线程池"""
+        if ws_future is not None and not ws_future.cancel():
+            wait((ws_future,))
+            self.client.close_ws_trade_api()
+        self._probe_pool.shutdown(wait=False, cancel_futures=True)
 
     # ==================== 回调处理 ====================
 
     def _on_position_opened(self, position):
-        """持仓开立回调"""
-        if self.config.SHOW_POSITION_UPDATES:
-            print(f"\n[持仓开立] {position.symbol} {position.side}")
-            print(f"  数量: {position.quantity}")
-            print(f"  入场价: {position.entry_price}")
+        """持仓开立回调（仅在SHOW_POSITION_UPDATES开启时注册）"""
+        console.info(
+            "\n[持仓开立] %s %s\n  数量: %s\n  入场价: %s",
+            position.symbol, position.side, position.quantity, position.entry_price
+        )
 
     def _on_position_closed(self, position):
-        """持仓平仓回调"""
-        if self.config.SHOW_POSITION_UPDATES:
-            pnl_color = "\033[92m" if position.realized_pnl > 0 else "\033[91m"
-            reset = "\033[0m"
-            print(f"\n[持仓平仓] {position.symbol}")
-            print(f"  盈亏: {pnl_color}{position.realized_pnl:+.4f} USDT{reset} ({position.get_pnl_percent():+.2f}%)")
-            print(f"  持仓时长: {position.holding_duration:.1f}秒")
-
-        # 记录交易
-        active_trades = self.trade_executor.get_active_trades()
-        for trade in active_trades:
-            if trade.signal.symbol == position.symbol:
-                self.trade_logger.add_trade(trade, exit_reason="closed")
-                break
+        """持仓平仓回调（仅在SHOW_POSITION_UPDATES开启时注册）"""
+        console.info(
+            _CLOSE_FMT,
+            position.symbol,
+            _GREEN if position.realized_pnl > 0 else _RED,
+            position.realized_pnl,
+            _RESET,
+            position.get_pnl_percent(),
+            position.holding_duration
+        )
+
+    def _record_closed_trade(self, trade, exit_reason: str):
+        """记录已完成交易（交易执行器在同步手续费后回调）"""
+        self.trade_logger.add_trade(trade, exit_reason=exit_reason)
 
     def _on_risk_warning(self, position):
         """风险警告回调"""
-        liq_distance = position.get_liquidation_distance()
-        print(f"\n⚠️  风险警告: {position.symbol}")
-        print(f"   清算距离: {liq_distance:.2f}%")
-        print(f"   未实现盈亏: {position.unrealized_pnl:.4f} USDT")
+        console.info(
+            "\n⚠️  风险警告: %s\n   清算距离: %.2f%%\n   未实现盈亏: %.4f USDT",
+            position.symbol, position.get_liquidation_distance(), position.unrealized_pnl
+        )
 
     def _on_pnl_update(self, position):
-        """盈亏更新回调"""
-        if self.config.SHOW_PNL_UPDATES and position.is_active:
-            print(f"\r[{position.symbol}] 盈亏: {position.unrealized_pnl:+.4f} USDT ({position.get_pnl_percent():+.2f}%)", end="")
+        """盈亏更新回调（仅在SHOW_PNL_UPDATES开启时注册；只入缓冲区，由后台线程输出）"""
+        if position.is_active:
+            self._pnl_buffer.append(
+                (position.symbol, position.unrealized_pnl, position.get_pnl_percent())
+            )
+
+    def _pnl_flush_loop(self):
+        """后台刷新盈亏显示
+
+        输出使用回车覆盖同一行，每个周期只需写出最新的一条。
+        """
+        buffer = self._pnl_buffer
+        while self.running:
+            time.sleep(self.PNL_FLUSH_INTERVAL)
+            latest = None
+            while buffer:
+                latest = buffer.popleft()
+            if latest is not None:
+                symbol, pnl, pnl_percent = latest
+                sys.stdout.write(f"\r[{symbol}] 盈亏: {pnl:+.4f} USDT ({pnl_percent:+.2f}%)")
+                sys.stdout.flush()
 
     # ==================== 导出和统计 ====================
 
@@ -356,9 +532,12 @@ class TestnetTradingRunner:
         """导出交易数据"""
         print("\n正在导出交易数据...")
 
-        # 导出为多种格式
-        json_file = self.trade_logger.export_for_analysis()
-        csv_file = self.trade_logger.export_to_csv()
+        # 导出为多种格式（对同一份记录快照并行写入两个文件）
+        records = tuple(self.trade_logger.get_records())
+        json_future = self._probe_pool.submit(self.trade_logger.export_for_analysis, records=records)
+        csv_future = self._probe_pool.submit(self.trade_logger.export_to_csv, records=records)
+        json_file = json_future.result()
+        csv_file = csv_future.result()
 
         print(f"  JSON: {json_file}")
         print(f"  CSV: {csv_file}")
@@ -369,7 +548,7 @@ class TestnetTradingRunner:
         Returns:
             状态字典
         """
-        uptime = time.time() - self._start_time if self._start_time > 0 else 0
+        uptime = time.monotonic() - self._start_time if self._start_time > 0 else 0
 
         return {
             "running": self.running,
@@ -403,13 +582,14 @@ class TestnetTradingRunner:
 
     def _print_config(self):
         """打印配置信息"""
+        cfg = self.config
         print(f"交易所: 币安期货测试网")
-        print(f"仓位大小: {self.config.POSITION_USDT} USDT")
-        print(f"杠杆: {self.config.LEVERAGE}x")
-        print(f"止损: {self.config.DEFAULT_STOP_LOSS_PERCENT}%")
-        print(f"止盈: {self.config.DEFAULT_TAKE_PROFIT_PERCENT}%")
-        print(f"最大每日交易: {self.config.MAX_DAILY_TRADES}")
-        print(f"最大连续亏损: {self.config.MAX_CONSECUTIVE_LOSSES}")
+        print(f"仓位大小: {cfg.POSITION_USDT} USDT")
+        print(f"杠杆: {cfg.LEVERAGE}x")
+        print(f"止损: {cfg.DEFAULT_STOP_LOSS_PERCENT}%")
+        print(f"止盈: {cfg.DEFAULT_TAKE_PROFIT_PERCENT}%")
+        print(f"最大每日交易: {cfg.MAX_DAILY_TRADES}")
+        print(f"最大连续亏损: {cfg.MAX_CONSECUTIVE_LOSSES}")
 
     def _signal_handler(self, signum, frame):
         """信号处理器"""
@@ -436,29 +616,23 @@ def main():
 
     # 启动
     runner.start()
+    if not runner.running:
+        return
 
-    # 模拟运行
+    # 事件驱动运行 (实际使用时由插针检测器回调 runner.submit_signal 投递信号)
+    # 示例:
+    # signal = {
+    #     "symbol": "BTCUSDT",
+    #     "direction": "DOWN",
+    #     "start_price": 95000,
+    #     "peak_price": 94500,
+    #     "entry_price": 94700,
+    #     "amplitude": 0.5,
+    #     "retracement": 30
+    # }
+    # runner.submit_signal(signal)
     try:
-        while runner.running:
-            time.sleep(1)
-
-            # 每10秒打印状态
-            if int(time.time()) % 10 == 0:
-                runner.print_status()
-
-            # 模拟信号 (实际使用时应该从test_pin_recorder.py获取)
-            # 示例:
-            # signal = {
-            #     "symbol": "BTCUSDT",
-            #     "direction": "DOWN",
-            #     "start_price": 95000,
-            #     "peak_price": 94500,
-            #     "entry_price": 94700,
-            #     "amplitude": 0.5,
-            #     "retracement": 30
-            # }
-            # runner.on_pin_signal(signal)
-
+        asyncio.run(runner.run())
     except KeyboardInterrupt:
         runner.stop()
 
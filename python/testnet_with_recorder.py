@@ -10,18 +10,37 @@
 2. 运行脚本: python testnet_with_recorder.py
 """
 
-import json
+import asyncio
 import os
+import queue
+import random
 import signal
 import sys
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from functools import partial
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
+import numpy as np
+import orjson
 import websocket
 
+try:
+    from picows import WSListener, WSMsgType, ws_connect
+    PICOWS_AVAILABLE = True
+except ImportError:
+    PICOWS_AVAILABLE = False
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 # 添加src目录到路径
 script_dir = Path(__file__).parent.resolve()
 sys.path.insert(0, str(script_dir / "src"))
@@ -64,6 +83,17 @@ USE_PROXY = True
 # WebSocket端点 - 使用测试网行情
 WS_ENDPOINT = "wss://stream.binancefuture.com/ws"
 
+# 行情连接优先使用picows（Cython实现，单帧开销更低）；未安装或需要代理时使用websocket-client
+USE_PICOWS = True
+
+# 行情连接分片数：交易对按轮询分配到多条连接，各连接在独立线程中收包和解析
+WS_SHARD_COUNT = 4
+
+# 断线重连：指数退避（1, 2, 4, 8...秒，上限30秒），每次等待加±20%抖动，避免各分片同时重连
+RECONNECT_INITIAL_DELAY = 1.0
+RECONNECT_MAX_DELAY = 30.0
+RECONNECT_JITTER = 0.2
+
 # 监控交易对
 DEFAULT_SYMBOLS = ["BTCUSDT", "ETHUSDT", "SOLUSDT", "BNBUSDT", "TRUMPUSDT",
                    "ZECUSDT", "VVVUSDT", "TAOUSDT", "RIVERUSDT", "POLUSDT",
@@ -75,259 +105,508 @@ DEFAULT_SYMBOLS = ["BTCUSDT", "ETHUSDT", "SOLUSDT", "BNBUSDT", "TRUMPUSDT",
                    "COMPUSDT", "TRBUSDT", "LINKUSDT", "PROMUSDT", "ORDIUSDT", "NEOUSDT",
                    "ICPUSDT", "DOTUSDT", "GASUSDT", "RPLUSDT", "APYUSDT", "MYXUSDT"]
 
+@dataclass(frozen=True, slots=True)
+class SpikeConfig:
+    """插针检测参数（运行期间只读，属性访问代替字符串键查找）"""
+    price_window_ms: int = 30000        # 检测窗口1秒
+    min_spike_percent: float = 0.65     # 最小插针幅度0.5%
+    max_spike_percent: float = 4.0      # 最大插针幅度5.0%
+    retracement_percent: float = 12     # 回撤至少15%
+
+
 # 插针检测参数
-SPIKE_CONFIG = {
-    "price_window_ms": 30000,        # 检测窗口1秒
-    "min_spike_percent": 0.65,       # 最小插针幅度0.5%
-    "max_spike_percent": 4.0,       # 最大插针幅度5.0%
-    "retracement_percent": 12,      # 回撤至少15%
-}
+SPIKE_CONFIG = SpikeConfig()
 
 # 对冲策略参数
-HEDGE_CONFIG = {
-    "enable_hedge": True,               # 启用对冲模式
-    "hedge_retracement_percent": 0.8,   # 盈利0.5%时开对冲腿（原50.0改为0.5，含义从回撤改为盈利）
-    "hedge_wait_timeout_seconds": 300,  # 等待对冲的超时时间(秒)，原60改为300（5分钟）
-    "close_order": "SHORT_FIRST",       # 平仓顺序: 先平空
-    "take_profit_after_hedge": 0.5,     # 对冲后止盈点(%)
-    "stop_loss_after_hedge": 1.0,       # 对冲后止损点(%)
-    "quick_tp_enabled": True,           # 启用第二腿快速止盈
-    "quick_tp_percent": 0.3,            # 第二腿快速止盈点位(%) - 盈利0.3%立即平仓
-}
+HEDGE_CONFIG = HedgeConfig(
+    enable_hedge=True,                  # 启用对冲模式
+    hedge_retracement_percent=0.8,      # 盈利0.5%时开对冲腿（原50.0改为0.5，含义从回撤改为盈利）
+    hedge_wait_timeout_seconds=300,     # 等待对冲的超时时间(秒)，原60改为300（5分钟）
+    close_order="SHORT_FIRST",          # 平仓顺序: 先平空
+    take_profit_after_hedge=0.5,        # 对冲后止盈点(%)
+    stop_loss_after_hedge=1.0,          # 对冲后止损点(%)
+    quick_tp_enabled=True,              # 启用第二腿快速止盈
+    quick_tp_percent=0.3,               # 第二腿快速止盈点位(%) - 盈利0.3%立即平仓
+)
 
 
 # ============== 插针检测器 ==============
 
+# PinDetector窗口状态矩阵的行号（每列对应一个交易对）
+_ROW_CURRENT_PRICE = 0
+_ROW_LAST_TRADE_TIME = 1
+_ROW_WINDOW_START = 2
+_ROW_WINDOW_START_PRICE = 3
+_ROW_WINDOW_HIGH = 4
+_ROW_WINDOW_LOW = 5
+_ROW_LAST_SIGNAL_TIME = 6
+_STATE_ROWS = 7
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _update_window_jit(i, price, ts_ms, state):
+        """逐笔更新窗口状态（编译版本，一次调用完成全部数组读写）"""
+        state[_ROW_CURRENT_PRICE, i] = price
+        state[_ROW_LAST_TRADE_TIME, i] = ts_ms
+        if state[_ROW_WINDOW_START, i] == 0:
+            state[_ROW_WINDOW_START, i] = ts_ms
+            state[_ROW_WINDOW_START_PRICE, i] = price
+            state[_ROW_WINDOW_HIGH, i] = price
+            state[_ROW_WINDOW_LOW, i] = price
+        elif price > state[_ROW_WINDOW_HIGH, i]:
+            state[_ROW_WINDOW_HIGH, i] = price
+        elif price < state[_ROW_WINDOW_LOW, i]:
+            state[_ROW_WINDOW_LOW, i] = price
+
+if PICOWS_AVAILABLE:
+    class _AggTradeListener(WSListener):
+        """picows监听器：文本帧直接交给PinDetector处理"""
+
+        def __init__(self, detector: "PinDetector", shard: int):
+            super().__init__()
+            self._detector = detector
+            self._shard = shard
+
+        def on_ws_connected(self, transport):
+            self._detector._on_open(self._shard, None)
+
+        def on_ws_frame(self, transport, frame):
+            if frame.msg_type == WSMsgType.TEXT:
+                # 直接交出原始字节，由解析器按字节截取字段，不做文本解码
+                self._detector._on_message(None, frame.get_payload_as_bytes())
+            elif frame.msg_type == WSMsgType.CLOSE:
+                transport.disconnect()
+
+        def on_ws_disconnected(self, transport):
+            self._detector._shard_connected[self._shard] = False
+
+
 class PinDetector:
     """插针检测器 - 检测市场价格快速波动（插针）"""
 
     # 信号冷却时间（毫秒）
     SIGNAL_COOLDOWN_MS = 5000
 
+    # 批量检测扫描间隔（秒）
+    SCAN_INTERVAL = 0.05
+
+    # 无持仓交易对的价格回调最小间隔（毫秒）
+    PRICE_EMIT_INTERVAL_MS = 50
+
     def __init__(self, symbols: List[str]):
-        self.symbols_upper = [s.upper() for s in symbols]
+        self.symbols_upper = [sys.intern(s.upper()) for s in symbols]
         self.symbols_lower = [s.lower() for s in symbols]
         self.running = False
-        self.ws_connected = False
-        self.ws = None
-        self.ws_thread = None
+        self.scan_thread = None
         self.message_count = 0
 
-        # 回调函数
-        self.on_signal = None
-        self.on_price_update = None
-
-        # 每个交易对的监控数据
-        self.monitors: Dict[str, Dict] = self._init_monitors()
+        # 行情连接分片（交易对互不重叠），每个分片一条连接、一个线程
+        shard_count = max(1, min(WS_SHARD_COUNT, len(self.symbols_lower)))
+        self.shards: List[List[str]] = [self.symbols_lower[k::shard_count] for k in range(shard_count)]
+        self._ws_urls: List[str] = [
+            f"{WS_ENDPOINT}/" + "/".join(f"{s}@aggTrade" for s in shard)
+            for shard in self.shards
+        ]
+        self.ws_list: List[websocket.WebSocketApp | None] = [None] * shard_count
+        self.ws_thread_list: List[threading.Thread | None] = [None] * shard_count
+        self._shard_connected: List[bool] = [False] * shard_count
+        self._reconnect_delays: List[float] = [RECONNECT_INITIAL_DELAY] * shard_count
+        self._stop_event = threading.Event()
+
+        # picows连接（仅在使用picows时有效）
+        self._ws_loops: List[asyncio.AbstractEventLoop | None] = [None] * shard_count
+        self._ws_transports: List = [None] * shard_count
+
+        # websocket-client运行参数：行情为合法JSON，跳过UTF-8校验
+        # （文本帧不再解码，on_message直接收到bytes，由解析器按字节处理）；
+        # 服务器约3分钟ping一次，客户端ping保持同频
+        self._run_kwargs = {
+            "skip_utf8_validation": True,
+            "ping_interval": 180,
+            "ping_timeout": 10,
+        }
+        if USE_PROXY:
+            self._run_kwargs.update(
+                http_proxy_host=PROXY_HOST,
+                http_proxy_port=PROXY_HTTP_PORT,
+                proxy_type="http"
+            )
 
-    def _init_monitors(self) -> Dict[str, Dict]:
+        # 回调函数（价格回调经属性设置，变更时重新生成_process_price）
+        self.on_signal = None
+        self._on_price_update = None
+        self._is_active_symbol = None
+
+        # 每个交易对的监控数据（按列存储，symbol_index给出行号）
+        # 行情线程写入、扫描线程读取并重置窗口，由_state_lock保护
+        self.symbol_index: Dict[str, int] = {}
+        self._sym_lookup: Dict[str | bytes, int] = {}
+        self._state_lock = threading.Lock()
+        self._init_monitors()
+
+        # 检测阈值（运行期间不变，预先取出）
+        self._window_ms = SPIKE_CONFIG.price_window_ms
+        self._min_amp = SPIKE_CONFIG.min_spike_percent
+        self._max_amp = SPIKE_CONFIG.max_spike_percent
+        self._min_retracement = SPIKE_CONFIG.retracement_percent
+
+    def _init_monitors(self):
         """初始化所有交易对的监控数据"""
-        return {
-            s: {
-                "current_price": 0.0,
-                "window_start": 0,
-                "window_start_price": 0.0,
-                "window_high": 0.0,
-                "window_low": float('inf'),
-                "last_signal_time": 0,
-            }
-            for s in self.symbols_upper
-        }
+        n = len(self.symbols_upper)
+        self.symbol_index = {s: i for i, s in enumerate(self.symbols_upper)}
+        # 行情解析得到的交易对可能是str或bytes切片，两种键都映射到同一行号
+        self._sym_lookup = {**self.symbol_index, **{s.encode(): i for s, i in self.symbol_index.items()}}
+        self._last_emit_ms = [0] * n
+
+        # 所有列放在一个连续矩阵中（便于编译内核单参数访问），按行取出命名视图
+        self._state = np.zeros((_STATE_ROWS, n))
+        self._state[_ROW_WINDOW_LOW] = np.inf
+        self.current_price = self._state[_ROW_CURRENT_PRICE]
+        self.last_trade_time = self._state[_ROW_LAST_TRADE_TIME]
+        self.window_start = self._state[_ROW_WINDOW_START]
+        self.window_start_price = self._state[_ROW_WINDOW_START_PRICE]
+        self.window_high = self._state[_ROW_WINDOW_HIGH]
+        self.window_low = self._state[_ROW_WINDOW_LOW]
+        self.last_signal_time = self._state[_ROW_LAST_SIGNAL_TIME]
+
+        # 状态数组已替换，重新生成逐笔处理函数
+        self._bind_process_price()
+
+    @property
+    def on_price_update(self):
+        """价格更新回调 callback(symbol, price, trade_time_ms)"""
+        return self._on_price_update
+
+    @on_price_update.setter
+    def on_price_update(self, callback):
+        self._on_price_update = callback
+        self._bind_process_price()
 
     def set_signal_callback(self, callback):
         """设置信号回调"""
         self.on_signal = callback
 
     def set_price_callback(self, callback):
-        """设置价格更新回调"""
+        """设置价格更新回调 callback(symbol, price, trade_time_ms)"""
         self.on_price_update = callback
 
+    def set_active_symbol_check(self, check):
+        """设置持仓判断函数 check(symbol) -> bool
+
+        设置后，无持仓的交易对价格回调按PRICE_EMIT_INTERVAL_MS限频，有持仓的逐笔回调。
+        """
+        self._is_active_symbol = check
+        self._bind_process_price()
+
     def start(self):
         """启动检测器"""
+        self._warm_up_jit()
         self.running = True
-        self._connect()
+        self._stop_event.clear()
+        self.scan_thread = threading.Thread(target=self._scan_loop, daemon=True)
+        self.scan_thread.start()
+        for shard in range(len(self.shards)):
+            self._connect(shard)
 
     def stop(self):
         """停止检测器"""
         self.running = False
-        if self.ws:
-            self.ws.close()
-
-    def _connect(self):
-        """连接WebSocket"""
-        streams = [f"{s}@aggTrade" for s in self.symbols_lower]
-        ws_url = f"{WS_ENDPOINT}/{'/'.join(streams)}"
-
-        print(f"[{format_time()}] 连接WebSocket: {ws_url[:80]}...")
+        self._stop_event.set()
+        for ws in self.ws_list:
+            if ws:
+                ws.close()
+        for loop, transport in zip(self._ws_loops, self._ws_transports):
+            if loop is not None and transport is not None:
+                loop.call_soon_threadsafe(transport.disconnect)
+
+    def _connect(self, shard: int):
+        """为指定分片创建WebSocket及其常驻线程（断线重连在线程内完成）"""
+        ws_url = self._ws_urls[shard]
+
+        if USE_PICOWS and PICOWS_AVAILABLE and not USE_PROXY:
+            self._ws_loops[shard] = asyncio.new_event_loop()
+            thread = threading.Thread(target=self._run_picows, args=(shard, ws_url), daemon=True)
+            self.ws_thread_list[shard] = thread
+            thread.start()
+            return
 
-        self.ws = websocket.WebSocketApp(
+        ws = websocket.WebSocketApp(
             ws_url,
             on_message=self._on_message,
             on_error=self._on_error,
-            on_close=self._on_close,
-            on_open=self._on_open
+            on_close=partial(self._on_close, shard),
+            on_open=partial(self._on_open, shard)
         )
+        self.ws_list[shard] = ws
+
+        thread = threading.Thread(target=self._run_ws, args=(shard,), daemon=True)
+        self.ws_thread_list[shard] = thread
+        thread.start()
+
+    def _next_reconnect_delay(self, shard: int) -> float:
+        """取出本次重连等待时间（带抖动），并将该分片的退避时间翻倍"""
+        delay = self._reconnect_delays[shard]
+        self._reconnect_delays[shard] = min(delay * 2, RECONNECT_MAX_DELAY)
+        return delay * random.uniform(1 - RECONNECT_JITTER, 1 + RECONNECT_JITTER)
+
+    def _run_ws(self, shard: int):
+        """连接循环：run_forever返回即断线，按指数退避等待后复用同一个WebSocketApp重连"""
+        ws = self.ws_list[shard]
+        while self.running:
+            print(f"[{format_time()}] 连接WebSocket[{shard}]: {self._ws_urls[shard][:80]}...")
+            ws.run_forever(**self._run_kwargs)
+
+            if not self.running:
+                break
+
+            delay = self._next_reconnect_delay(shard)
+            print(f"[{format_time()}] WebSocket[{shard}] {delay:.1f}秒后重连...")
+            if self._stop_event.wait(delay):
+                break
+
+    def _run_picows(self, shard: int, ws_url: str):
+        """picows事件循环线程"""
+        loop = self._ws_loops[shard]
+        asyncio.set_event_loop(loop)
+        loop.run_until_complete(self._picows_loop(shard, ws_url))
+        loop.close()
+
+    async def _picows_loop(self, shard: int, ws_url: str):
+        """picows连接循环（断开后按指数退避重连）"""
+        while self.running:
+            print(f"[{format_time()}] 连接WebSocket[{shard}]: {ws_url[:80]}...")
+            try:
+                transport, _ = await ws_connect(lambda: _AggTradeListener(self, shard), ws_url)
+                self._ws_transports[shard] = transport
+                await transport.wait_disconnected()
+            except Exception as e:
+                print(f"[{format_time()}] WebSocket[{shard}]错误: {str(e)[:80]}")
 
-        def run_ws():
-            if USE_PROXY:
-                self.ws.run_forever(
-                    http_proxy_host=PROXY_HOST,
-                    http_proxy_port=PROXY_HTTP_PORT,
-                    proxy_type="http"
-                )
-            else:
-                self.ws.run_forever()
-
-        self.ws_thread = threading.Thread(target=run_ws, daemon=True)
-        self.ws_thread.start()
+            self._ws_transports[shard] = None
+            self._shard_connected[shard] = False
+            print(f"[{format_time()}] WebSocket[{shard}]断开")
+            if self.running:
+                delay = self._next_reconnect_delay(shard)
+                print(f"[{format_time()}] WebSocket[{shard}] {delay:.1f}秒后重连...")
+                await asyncio.sleep(delay)
 
-    def _on_open(self, ws):
-        self.ws_connected = True
-        print(f"[{format_time()}] ✅ WebSocket已连接")
+    def _on_open(self, shard: int, ws):
+        self._shard_connected[shard] = True
+        self._reconnect_delays[shard] = RECONNECT_INITIAL_DELAY
+        print(f"[{format_time()}] ✅ WebSocket[{shard}]已连接")
 
     def _on_error(self, ws, error):
         if error:
             print(f"[{format_time()}] WebSocket错误: {str(error)[:80]}")
 
-    def _on_close(self, ws, code, msg):
-        self.ws_connected = False
-        print(f"[{format_time()}] WebSocket断开")
-        if self.running:
-            print(f"[{format_time()}] 2秒后重连...")
-            time.sleep(2)
-            self._connect()
+    def _on_close(self, shard: int, ws, code, msg):
+        self._shard_connected[shard] = False
+        print(f"[{format_time()}] WebSocket[{shard}]断开")
+
+    @staticmethod
+    def _parse_aggtrade(message: str | bytes) -> Tuple[str | bytes, float, int]:
+        """从aggTrade消息中直接截取 s/p/T 三个字段
+
+        只定位需要的字段并切片，不构建完整字典；字段缺失时回退到完整解析。
+        bytes消息直接按字节查找，不解码，交易对以bytes切片返回。
+
+        Returns:
+            (交易对, 价格, 成交时间戳ms)
+        """
+        if isinstance(message, bytes):
+            s_pos = message.find(b'"s":"')
+            p_pos = message.find(b'"p":"')
+            t_pos = message.find(b'"T":')
+            quote, comma, brace = b'"', b',', b'}'
+        else:
+            s_pos = message.find('"s":"')
+            p_pos = message.find('"p":"')
+            t_pos = message.find('"T":')
+            quote, comma, brace = '"', ',', '}'
+        if s_pos < 0 or p_pos < 0 or t_pos < 0:
+            data = orjson.loads(message)
+            return data.get('s', ''), float(data['p']), data['T']
+
+        s_pos += 5
+        p_pos += 5
+        t_pos += 4
+        t_end = message.find(comma, t_pos)
+        if t_end < 0:
+            t_end = message.find(brace, t_pos)
+
+        return (
+            message[s_pos:message.find(quote, s_pos)],
+            float(message[p_pos:message.find(quote, p_pos)]),
+            int(message[t_pos:t_end])
+        )
 
-    def _on_message(self, ws, message):
-        """处理价格消息"""
+    def _on_message(self, ws, message: str | bytes):
+        """处理价格消息（两种连接均交付原始bytes，str仅作兼容）"""
         try:
             self.message_count += 1
-            data = json.loads(message)
+            sym_key, price, trade_time = self._parse_aggtrade(message)
 
-            symbol = data.get('s', '').upper()
-            if symbol not in self.monitors:
+            # aggTrade的s字段本身为大写，直接按原样查找行号
+            i = self._sym_lookup.get(sym_key)
+            if i is None:
                 return
 
-            price = float(data['p'])
-            timestamp = datetime.fromtimestamp(data['T'] / 1000, tz=BEIJING_TZ)
-
-            self._process_price(symbol, price, timestamp)
+            # 向下游传递启动时驻留的交易对字符串，回调中的字典查找可走身份比较快路径
+            self._process_price(i, self.symbols_upper[i], price, trade_time)
         except Exception:
             pass  # 静默忽略解析错误
 
-    def _process_price(self, symbol: str, price: float, timestamp: datetime):
-        """处理价格更新"""
-        monitor = self.monitors[symbol]
-        now_ms = timestamp.timestamp() * 1000
-
-        monitor["current_price"] = price
-
-        # 触发价格更新回调
-        if self.on_price_update:
-            self.on_price_update(symbol, price, timestamp)
-
-        # 初始化窗口
-        if monitor["window_start"] == 0:
-            monitor["window_start"] = now_ms
-            monitor["window_start_price"] = price
-            monitor["window_high"] = price
-            monitor["window_low"] = price
-            return
+    @staticmethod
+    def _warm_up_jit():
+        """在行情线程和扫描线程启动前完成编译内核的编译/缓存加载
+
+        numba在首次调用时才编译，若发生在首笔行情的_state_lock内会阻塞分片线程和扫描线程。
+        这里用与实盘调用相同的参数类型（int, float, int, float64二维数组）在一次性状态上调用一次。
+        """
+        if NUMBA_AVAILABLE:
+            _update_window_jit(0, 0.0, 0, np.zeros((_STATE_ROWS, 1)))
+
+    def _bind_process_price(self):
+        """生成逐笔处理函数_process_price（状态初始化及回调变更时调用）
+
+        回调、限频间隔、锁和状态数组在运行期间不变，作为闭包变量固化，
+        逐笔调用不再经过实例属性和类常量查找，也不创建绑定方法。
+        只更新窗口数据，插针检测由扫描线程批量完成；时间保持为成交时间戳(ms)。
+        """
+        callback = self._on_price_update
+        is_active = self._is_active_symbol
+        emit_interval = self.PRICE_EMIT_INTERVAL_MS
+        last_emit = self._last_emit_ms
+        lock = self._state_lock
+        state = self._state
+        use_jit = NUMBA_AVAILABLE
+        current_price = self.current_price
+        last_trade_time = self.last_trade_time
+        window_start = self.window_start
+        window_start_price = self.window_start_price
+        window_high = self.window_high
+        window_low = self.window_low
+
+        def process_price(i: int, symbol: str, price: float, now_ms: int):
+            # 触发价格更新回调（无持仓的交易对限频）
+            if callback is not None and (
+                is_active is None
+                or is_active(symbol)
+                or now_ms - last_emit[i] >= emit_interval
+            ):
+                last_emit[i] = now_ms
+                callback(symbol, price, now_ms)
+
+            if use_jit:
+                with lock:
+                    _update_window_jit(i, price, now_ms, state)
+                return
 
-        # 更新高低点
-        monitor["window_high"] = max(monitor["window_high"], price)
-        monitor["window_low"] = min(monitor["window_low"], price)
-
-        # 检测插针（窗口期满）
-        if now_ms - monitor["window_start"] >= SPIKE_CONFIG["price_window_ms"]:
-            self._detect_spike(symbol, price, timestamp, monitor)
-            self._reset_window(monitor, now_ms, price)
-
-    def _reset_window(self, monitor: Dict, now_ms: int, price: float):
-        """重置检测窗口"""
-        monitor["window_start"] = now_ms
-        monitor["window_start_price"] = price
-        monitor["window_high"] = price
-        monitor["window_low"] = price
-
-    def _detect_spike(self, symbol: str, price: float, timestamp: datetime, monitor: Dict):
-        """检测插针"""
-        start = monitor["window_start_price"]
-        high = monitor["window_high"]
-        low = monitor["window_low"]
-
-        if start == 0:
-            return
+            with lock:
+                current_price[i] = price
+                last_trade_time[i] = now_ms
+
+                # 初始化窗口
+                if window_start[i] == 0:
+                    window_start[i] = now_ms
+                    window_start_price[i] = price
+                    window_high[i] = price
+                    window_low[i] = price
+                    return
+
+                # 更新高低点
+                if price > window_high[i]:
+                    window_high[i] = price
+                elif price < window_low[i]:
+                    window_low[i] = price
+
+        self._process_price = process_price
+
+    def _scan_loop(self):
+        """定时批量检测插针"""
+        while self.running:
+            time.sleep(self.SCAN_INTERVAL)
+            try:
+                self._vectorized_scan()
+            except Exception as e:
+                print(f"[{format_time()}] 插针检测错误: {e}")
 
-        now_ms = timestamp.timestamp() * 1000
-        if now_ms - monitor["last_signal_time"] < self.SIGNAL_COOLDOWN_MS:
-            return  # 冷却中
+    def _vectorized_scan(self):
+        """对窗口期满的交易对批量计算振幅和回撤，并重置其窗口
 
-        signal = self._try_detect_up_spike(symbol, start, high, low, price, timestamp)
-        if signal is None:
-            signal = self._try_detect_down_spike(symbol, start, high, low, price, timestamp)
+        窗口期满以各交易对最后一笔成交时间判断，检测价格为该笔成交价。
+        """
+        with self._state_lock:
+            trade_time = self.last_trade_time
+            expired = (self.window_start > 0) & (
+                trade_time - self.window_start >= self._window_ms
+            )
+            if not expired.any():
+                return
+            rows = np.nonzero(expired)[0]
+
+            start = self.window_start_price[rows]
+            high = self.window_high[rows]
+            low = self.window_low[rows]
+            price = self.current_price[rows]
+            now_ms = trade_time[rows]
+
+            # 重置检测窗口（从最后一笔成交开始新窗口）
+            self.window_start[rows] = now_ms
+            self.window_start_price[rows] = price
+            self.window_high[rows] = price
+            self.window_low[rows] = price
+
+        min_amp = self._min_amp
+        max_amp = self._max_amp
+        min_retracement = self._min_retracement
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            amp_up = (high - start) / start * 100
+            ret_up = (high - price) / (high - start) * 100
+            amp_down = (start - low) / start * 100
+            ret_down = (price - low) / (start - low) * 100
+
+        # 冷却中的交易对不检测
+        ready = (start != 0) & (now_ms - self.last_signal_time[rows] >= self.SIGNAL_COOLDOWN_MS)
+        up = (
+            ready & (high > start)
+            & (min_amp <= amp_up) & (amp_up <= max_amp)
+            & (ret_up >= min_retracement)
+        )
+        down = (
+            ready & ~up & (start > low)
+            & (min_amp <= amp_down) & (amp_down <= max_amp)
+            & (ret_down >= min_retracement)
+        )
 
-        if signal:
-            monitor["last_signal_time"] = now_ms
+        for k in np.nonzero(up | down)[0]:
+            i = int(rows[k])
+            if up[k]:
+                direction, peak = "UP", high[k]
+                amplitude, retracement = amp_up[k], ret_up[k]
+            else:
+                direction, peak = "DOWN", low[k]
+                amplitude, retracement = amp_down[k], ret_down[k]
+
+            self.last_signal_time[i] = now_ms[k]
+            signal = PinSignal(
+                symbol=self.symbols_upper[i],
+                direction=direction,
+                start_price=float(start[k]),
+                peak_price=float(peak),
+                entry_price=float(price[k]),
+                amplitude=float(amplitude),
+                retracement=float(retracement),
+                detected_at=datetime.fromtimestamp(now_ms[k] / 1000, tz=BEIJING_TZ)
+            )
             print(f"\n🔔 [{format_time()}] 检测到插针: {signal}")
             if self.on_signal:
                 self.on_signal(signal)
 
-    def _try_detect_up_spike(self, symbol: str, start: float, high: float,
-                            low: float, price: float, timestamp: datetime) -> PinSignal | None:
-        """尝试检测上插针"""
-        if high <= start:
-            return None
-
-        amplitude = (high - start) / start * 100
-        min_amp = SPIKE_CONFIG["min_spike_percent"]
-        max_amp = SPIKE_CONFIG["max_spike_percent"]
-
-        if not (min_amp <= amplitude <= max_amp):
-            return None
-
-        retracement = (high - price) / (high - start) * 100
-        if retracement >= SPIKE_CONFIG["retracement_percent"]:
-            return PinSignal(
-                symbol=symbol,
-                direction="UP",
-                start_price=start,
-                peak_price=high,
-                entry_price=price,
-                amplitude=amplitude,
-                retracement=retracement,
-                detected_at=timestamp
-            )
-        return None
-
-    def _try_detect_down_spike(self, symbol: str, start: float, high: float,
-                              low: float, price: float, timestamp: datetime) -> PinSignal | None:
-        """尝试检测下插针"""
-        if start <= low:
-            return None
-
-        amplitude = (start - low) / start * 100
-        min_amp = SPIKE_CONFIG["min_spike_percent"]
-        max_amp = SPIKE_CONFIG["max_spike_percent"]
-
-        if not (min_amp <= amplitude <= max_amp):
-            return None
-
-        retracement = (price - low) / (start - low) * 100
-        if retracement >= SPIKE_CONFIG["retracement_percent"]:
-            return PinSignal(
-                symbol=symbol,
-                direction="DOWN",
-                start_price=start,
-                peak_price=low,
-                entry_price=price,
-                amplitude=amplitude,
-                retracement=retracement,
-                detected_at=timestamp
-            )
-        return None
-
     def is_connected(self) -> bool:
-        return self.ws_connected
+        """所有分片均已连接"""
+        return all(self._shard_connected)
 
 
 # ============== 对冲策略运行器 ==============
@@ -345,6 +624,11 @@ class HedgeStrategyRunner:
         self.running = False
         self._start_time: float | None = None
         self._signals_count = 0
+        self._stop_event = threading.Event()
+
+        # 价格更新队列：行情线程只入队，由独立线程调用对冲管理器，避免对冲侧锁等待/日志阻塞收包
+        self._tick_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._tick_thread: threading.Thread | None = None
 
         # 初始化日志系统
         self.bot_logger = setup_logging(log_dir="logs", console_level="INFO")
@@ -362,14 +646,11 @@ class HedgeStrategyRunner:
         # 初始化交易日志记录器
         self.logger = HedgeTradeLogger(log_dir="hedge_trades", auto_save=True)
 
-        # 创建对冲配置
-        hedge_cfg = HedgeConfig(**HEDGE_CONFIG)
-
         # 初始化对冲交易管理器
         self.hedge_manager = HedgeTradeManager(
             client=self.client,
             config=self.config,
-            hedge_config=hedge_cfg,
+            hedge_config=HEDGE_CONFIG,
             logger=self.logger
         )
 
@@ -396,6 +677,9 @@ class HedgeStrategyRunner:
         self.detector = PinDetector(symbols)
         self.detector.set_signal_callback(self._on_pin_signal)
         self.detector.set_price_callback(self._on_price_update)
+        self.detector.set_active_symbol_check(self.hedge_manager.has_position)
+        self._tick_thread = threading.Thread(target=self._tick_loop, daemon=True)
+        self._tick_thread.start()
         self.detector.start()
         self.hedge_manager.start_monitoring()
 
@@ -415,8 +699,8 @@ class HedgeStrategyRunner:
         """记录会话开始"""
         logger.session_start({
             "symbols": symbols,
-            "spike_config": SPIKE_CONFIG,
-            "hedge_config": HEDGE_CONFIG,
+            "spike_config": asdict(SPIKE_CONFIG),
+            "hedge_config": asdict(HEDGE_CONFIG),
             "trading_config": {
                 "position_usdt": self.config.POSITION_USDT,
                 "leverage": self.config.LEVERAGE,
@@ -464,23 +748,19 @@ class HedgeStrategyRunner:
         logger.info("对冲策略运行器已启动")
         logger.info(f"监控: {symbols_display}")
         logger.info(f"配置: {self.config.POSITION_USDT} USDT × {self.config.LEVERAGE}x")
-        logger.debug(f"对冲回撤: {HEDGE_CONFIG['hedge_retracement_percent']}% | "
-                    f"止盈: {HEDGE_CONFIG['take_profit_after_hedge']}% | "
-                    f"止损: {HEDGE_CONFIG['stop_loss_after_hedge']}%")
+        logger.debug(f"对冲回撤: {HEDGE_CONFIG.hedge_retracement_percent}% | "
+                    f"止盈: {HEDGE_CONFIG.take_profit_after_hedge}% | "
+                    f"止损: {HEDGE_CONFIG.stop_loss_after_hedge}%")
         logger.info(f"{'='*60}")
         logger.info("等待信号...")
 
     def _main_loop(self):
         """主循环"""
         try:
-            last_status_time = 0
             while self.running:
-                time.sleep(0.1)
-
-                now = time.time()
-                if now - last_status_time >= self.STATUS_INTERVAL_SECONDS:
-                    self._print_status()
-                    last_status_time = now
+                self._print_status()
+                if self._stop_event.wait(self.STATUS_INTERVAL_SECONDS):
+                    break
         except KeyboardInterrupt:
             pass
         finally:
@@ -502,9 +782,26 @@ class HedgeStrategyRunner:
         # 执行对冲策略
         self.hedge_manager.on_pin_signal(signal)
 
-    def _on_price_update(self, symbol: str, price: float, timestamp: datetime):
-        """处理价格更新"""
-        self.hedge_manager.on_price_update(symbol, price, timestamp)
+    def _on_price_update(self, symbol: str, price: float, trade_time_ms: int):
+        """处理价格更新（在行情线程中调用，只入队不阻塞）"""
+        self._tick_queue.put_nowait((symbol, price))
+
+    def _tick_loop(self):
+        """价格更新处理线程：按到达顺序转交对冲管理器（对冲管理器不使用时间戳）
+
+        停止后丢弃队列中剩余的tick，避免平仓期间仍按过期价格开对冲腿。
+        """
+        get = self._tick_queue.get
+        stopping = self._stop_event.is_set
+        on_price_update = self.hedge_manager.on_price_update
+        while True:
+            tick = get()
+            if tick is None or stopping():
+                break
+            try:
+                on_price_update(*tick)
+            except Exception as e:
+                self.bot_logger.error(f"价格更新处理错误: {e}")
 
     def _on_hedge_opened(self, hedge: HedgePosition):
         """对冲完成回调（已在hedge_manager中记录日志）"""
@@ -545,12 +842,17 @@ class HedgeStrategyRunner:
         logger = self.bot_logger
         logger.warning("\n正在停止...")
         self.running = False
+        self._stop_event.set()
 
         # 停止持仓监控器和检测器
         if hasattr(self, 'hedge_manager'):
             self.hedge_manager.stop_monitoring()
         if hasattr(self, 'detector'):
             self.detector.stop()
+        # 等待价格处理线程退出（正在处理的tick完成后即退出），之后再平仓
+        if self._tick_thread is not None:
+            self._tick_queue.put(None)
+            self._tick_thread.join()
 
         # 平掉所有持仓
         self._close_all_positions(logger)
@@ -582,17 +884,20 @@ class HedgeStrategyRunner:
                 logger.error(f"平仓失败: {e}")
 
     def _export_trade_logs(self, logger: BotLogger):
-        """导出交易日志"""
+        """导出交易日志（对同一份记录快照并行写入JSON和CSV）"""
         logger.info("导出交易数据...")
+        records = tuple(self.logger.get_records())
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            json_future = pool.submit(self.logger.export_to_json, records=records)
+            csv_future = pool.submit(self.logger.export_to_csv, records=records)
+
         try:
-            json_path = self.logger.export_to_json()
-            logger.info(f"   JSON: {json_path}")
+            logger.info(f"   JSON: {json_future.result()}")
         except Exception as e:
             logger.warning(f"   JSON导出失败: {e}")
 
         try:
-            csv_path = self.logger.export_to_csv()
-            logger.info(f"   CSV: {csv_path}")
+            logger.info(f"   CSV: {csv_future.result()}")
         except Exception as e:
             logger.warning(f"   CSV导出失败: {e}")
 
@@ -620,6 +925,7 @@ class HedgeStrategyRunner:
     def _signal_handler(self, signum, frame):
         """信号处理器"""
         self.bot_logger.warning("收到停止信号，正在安全停止...")
+        self._stop_event.set()
         self.stop()
 
     def _save_runtime_config(self, symbols: List[str]):
@@ -628,8 +934,8 @@ class HedgeStrategyRunner:
             "script_version": "1.0",
             "start_time": datetime.now(BEIJING_TZ).isoformat(),
             "symbols": symbols,
-            "spike_config": SPIKE_CONFIG,
-            "hedge_config": HEDGE_CONFIG,
+            "spike_config": asdict(SPIKE_CONFIG),
+            "hedge_config": asdict(HEDGE_CONFIG),
             "trading_config": {
                 "position_usdt": self.config.POSITION_USDT,
                 "leverage": self.config.LEVERAGE,